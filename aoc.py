@@ -1,55 +1,117 @@
 #!/usr/bin/env python3
-import importlib
+"""Entry point of the aoc command line.
+
+The typer app lives in aoclib.cli. Importing typer, and rich through it, takes
+longer than running most days, so plain ``aoc run DAY`` invocations are
+handled here without importing it. Anything else goes through typer.
+"""
 import sys
-from pathlib import Path
 
-import click
-import typer
+# flags of `aoc run` understood by the fast path, and the option each one sets
+FAST_RUN_FLAGS = {
+    "--example": ("example", True),
+    "--no-example": ("example", False),
+    "--json": ("json_output", True),
+    "--cache": ("use_cache", True),
+    "--no-cache": ("use_cache", False),
+    "--refresh": ("refresh", True),
+    "--no-refresh": ("refresh", False),
+    "--parse-cache": ("parse_cache", True),
+    "--no-parse-cache": ("parse_cache", False),
+    "--daemon": ("daemon", True),
+    "--no-daemon": ("daemon", False),
+}
 
-app = typer.Typer(no_args_is_help=True)
 
+def parse_fast_run(argv: list[str]):
+    if len(argv) < 2 or argv[0] != "run" or not argv[1].isdigit():
+        return None
 
-python_template = """\
-def main(data: str):
-    pass
-"""
+    options = {
+        "example": False,
+        "json_output": False,
+        "use_cache": True,
+        "refresh": False,
+        "parse_cache": True,
+        "daemon": True,
+    }
+    for arg in argv[2:]:
+        if arg not in FAST_RUN_FLAGS:
+            return None
+        name, value = FAST_RUN_FLAGS[arg]
+        options[name] = value
+    return argv[1], options
+
+
+def fast_run(
+    day: str,
+    *,
+    example: bool,
+    json_output: bool,
+    use_cache: bool,
+    refresh: bool,
+    parse_cache: bool,
+    daemon: bool,
+):
+    """Run a day, and get the exit code or None to leave it to the cli"""
+    from aoclib.inputs import Input
+
+    data = Input.for_day(day, example=example)
+    if data.path is None or not data.path.is_file():
+        # leave the error message to the cli
+        return None
+
+    if daemon:
+        from aoclib.daemon import run_remote
+
+        status = run_remote(
+            day,
+            example=example,
+            json_output=json_output,
+            use_cache=use_cache,
+            refresh=refresh,
+            parse_cache=parse_cache,
+        )
+        if status is not None:
+            return status
+
+    from aoclib.cache import AnswerCache, ParseCache
+    from aoclib.runner import print_result, solve_cached
 
+    cache = AnswerCache() if use_cache else None
+    results = solve_cached(
+        day,
+        data,
+        cache=cache,
+        refresh=refresh,
+        parse_cache=ParseCache() if parse_cache else None,
+    )
+    for result in results:
+        print_result(result, json_output=json_output)
+    return 0
 
-@app.command()
-def init(day: str):
-    """Create a new AOC challenge solution."""
-    day_root = Path(f"day{day}")
-    day_root.mkdir(exist_ok=True)
 
-    pyfile = "__init__.py"
-    paths = ["data.txt", "example.txt"]
-    for p in paths:
-        pth = day_root / p
-        pth.touch()
+def main(argv: list[str] | None = None):
+    if argv is None:
+        argv = sys.argv[1:]
 
-    pyfilepth = day_root / pyfile
-    if not pyfilepth.exists():
-        pyfilepth.write_text(python_template)
+    fast = parse_fast_run(argv)
+    if fast is not None and (status := fast_run(fast[0], **fast[1])) is not None:
+        return status
 
+    from aoclib.cli import app
 
-def getdata(day: str, *, example: bool):
-    name = "data"
-    if example:
-        name = "example"
+    return app(args=argv)
 
-    file = Path(f"day{day}/{name}.txt")
-    try:
-        return file.read_text()
-    except FileNotFoundError:
-        raise click.FileError(str(file), "File does not exist")
 
+def __getattr__(name: str):
+    # `aoc:app` stays importable without paying for typer up front
+    if name == "app":
+        from aoclib.cli import app
 
-@app.command()
-def run(day: str, example: bool = False):
-    """Run an aoc challenge"""
-    data = getdata(day, example=example)
-    return importlib.import_module(f"day{day}").main(data)
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
-    sys.exit(app())
+    sys.exit(main())
@@ -0,0 +1,37 @@
+from aocgrid.coords import (
+    offset,
+    pack,
+    pack_array,
+    row_start,
+    unpack,
+    unpack_array,
+)
+from aocgrid.grid import (
+    DIRECTIONS,
+    byte_table,
+    find,
+    flat_index,
+    in_bounds,
+    neighbours,
+    parse_grid,
+    to_dense,
+    unflatten,
+)
+
+__all__ = [
+    "DIRECTIONS",
+    "byte_table",
+    "find",
+    "flat_index",
+    "in_bounds",
+    "neighbours",
+    "offset",
+    "pack",
+    "pack_array",
+    "parse_grid",
+    "row_start",
+    "to_dense",
+    "unflatten",
+    "unpack",
+    "unpack_array",
+]
@@ -0,0 +1,43 @@
+"""``(x, y)`` coordinates packed into a single int.
+
+Both components are biased by ``2**31`` so negative coordinates pack too, and
+each takes 32 bits of the key. Packed keys hash and compare as plain ints, so
+sets and dicts of them take a fraction of the memory of tuples, and moving a
+key is a single addition of an :func:`offset`.
+"""
+import numpy as np
+
+BIAS = 1 << 31
+MASK = (1 << 32) - 1
+
+
+def pack(x: int, y: int) -> int:
+    return (y + BIAS) << 32 | (x + BIAS)
+
+
+def unpack(key: int) -> tuple[int, int]:
+    return (key & MASK) - BIAS, (key >> 32) - BIAS
+
+
+def offset(dx: int, dy: int) -> int:
+    """Get what to add to a key to move it by ``(dx, dy)``"""
+    return (dy << 32) + dx
+
+
+def row_start(y: int) -> int:
+    """Get the smallest key of row ``y``. Keys sort by row first."""
+    return (y + BIAS) << 32
+
+
+def pack_array(xy: np.ndarray) -> np.ndarray:
+    """Pack an ``(n, 2)`` array of ``(x, y)`` into ``uint64`` keys"""
+    xy = np.asarray(xy, dtype=np.int64).reshape(-1, 2) + BIAS
+    return xy[:, 1].astype(np.uint64) << np.uint64(32) | xy[:, 0].astype(np.uint64)
+
+
+def unpack_array(keys: np.ndarray) -> np.ndarray:
+    """Unpack keys into an ``(n, 2)`` array of ``(x, y)``"""
+    keys = np.asarray(keys, dtype=np.uint64)
+    x = (keys & np.uint64(MASK)).astype(np.int64) - BIAS
+    y = (keys >> np.uint64(32)).astype(np.int64) - BIAS
+    return np.stack([x, y], axis=-1)
@@ -0,0 +1,94 @@
+"""Dense grids of bytes backed by numpy arrays.
+
+Cells are addressed either as ``(y, x)`` pairs, matching numpy's row major
+order, or by their flat index ``y * width + x`` into the raveled grid.
+"""
+import numpy as np
+
+# (dy, dx) of the four orthogonal neighbours: north, south, west, east
+DIRECTIONS = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)])
+
+
+def parse_grid(data: str | bytes, table: np.ndarray | None = None) -> np.ndarray:
+    """Parse lines of equal length into a 2d ``uint8`` array of their bytes.
+
+    The bytes are mapped through ``table``, an array of 256 values, if given.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    data = data.rstrip(b"\n")
+    width = data.find(b"\n")
+    if width < 0:
+        width = len(data)
+
+    buf = np.frombuffer(data + b"\n", dtype=np.uint8)
+    if buf.size % (width + 1):
+        raise ValueError("the lines of a grid must have the same length")
+    rows = buf.reshape(-1, width + 1)
+    if np.any(rows[:, width] != ord("\n")):
+        raise ValueError("the lines of a grid must have the same length")
+
+    if table is not None:
+        return table[rows[:, :width]]
+    return rows[:, :width].copy()
+
+
+def byte_table(mapping: dict[str, int], dtype="uint8", default=0) -> np.ndarray:
+    """Build a table for :func:`parse_grid` from a mapping of characters"""
+    table = np.full(256, default, dtype=dtype)
+    for char, value in mapping.items():
+        table[ord(char)] = value
+    return table
+
+
+def find(grid: np.ndarray, value: int) -> tuple[int, int]:
+    """Get the ``(y, x)`` of the first cell holding ``value``"""
+    flat = np.flatnonzero(grid == value)
+    if not flat.size:
+        raise ValueError(f"{value!r} is not in the grid")
+    y, x = np.divmod(int(flat[0]), grid.shape[1])
+    return y, x
+
+
+def in_bounds(shape: tuple[int, int], y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    return (y >= 0) & (y < shape[0]) & (x >= 0) & (x < shape[1])
+
+
+def flat_index(shape: tuple[int, int], y, x):
+    return y * shape[1] + x
+
+
+def unflatten(shape: tuple[int, int], index):
+    """Get the ``(y, x)`` of flat indices"""
+    return np.divmod(index, shape[1])
+
+
+def neighbours(shape: tuple[int, int], index: np.ndarray):
+    """Get the flat indices of the four neighbours of every cell in ``index``.
+
+    Returns an ``(n, 4)`` array of indices in the order of
+    :data:`DIRECTIONS` and a mask of which of them are inside the grid. Indices
+    outside of the grid are -1.
+    """
+    y, x = unflatten(shape, np.asarray(index))
+    ny = y[..., None] + DIRECTIONS[:, 0]
+    nx = x[..., None] + DIRECTIONS[:, 1]
+    valid = in_bounds(shape, ny, nx)
+    return np.where(valid, flat_index(shape, ny, nx), -1), valid
+
+
+def to_dense(
+    points: np.ndarray, value: int = 1, fill: int = 0, dtype="uint8", margin: int = 0
+):
+    """Draw sparse ``(x, y)`` points onto a dense grid that just fits them.
+
+    Returns the grid, indexed ``[y, x]``, and the ``(x, y)`` of its top left
+    corner. ``margin`` cells are added on every side.
+    """
+    points = np.asarray(points).reshape(-1, 2)
+    low = points.min(axis=0) - margin
+    high = points.max(axis=0) + margin
+    width, height = high - low + 1
+    grid = np.full((height, width), fill, dtype=dtype)
+    grid[points[:, 1] - low[1], points[:, 0] - low[0]] = value
+    return grid, (int(low[0]), int(low[1]))
@@ -0,0 +1,90 @@
+import contextlib
+import functools
+import importlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, TypeVar
+
+from aoclib.inputs import Input
+from aoclib.runner import DayOutput, run_captured
+
+DEFAULT_CHUNK_SIZE = 16
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchItem:
+    index: int
+    path: str
+    output: DayOutput
+
+    @property
+    def answers(self):
+        return [r.answer for r in self.output.results if r.part != "parse"]
+
+    @property
+    def error(self):
+        if self.output.error is None:
+            return None
+        return self.output.error.strip().splitlines()[-1]
+
+    def to_dict(self):
+        return {
+            "input": self.path,
+            "answers": self.answers,
+            "seconds": self.output.seconds,
+            "error": self.output.error,
+        }
+
+    def format(self):
+        if self.error is not None:
+            return f"{self.path}\terror: {self.error}"
+        # keep multi-line answers on the input's line
+        answers = (str(a).replace("\n", "\\n") for a in self.answers)
+        return "\t".join([self.path, *answers])
+
+
+def load_day(day: str):
+    # a day that fails to import is reported for each input instead
+    with contextlib.suppress(Exception):
+        importlib.import_module(f"day{day}")
+
+
+def solve_chunk(day: str, chunk: list[tuple[int, str]]):
+    return [
+        BatchItem(i, path, run_captured(day, Input(Path(path)))) for i, path in chunk
+    ]
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    it = iter(items)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def run_batch(
+    day: str,
+    paths: Iterable[str],
+    *,
+    jobs: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[BatchItem]:
+    """Solve every input with a pool of workers that each import the day once.
+
+    Inputs are sent to the workers ``chunk_size`` at a time. Results are
+    yielded in input order, or as soon as their chunk is done when not
+    ``ordered``.
+    """
+    chunks = chunked(enumerate(paths), chunk_size)
+    with ProcessPoolExecutor(jobs, initializer=load_day, initargs=(day,)) as pool:
+        if ordered:
+            for items in pool.map(functools.partial(solve_chunk, day), chunks):
+                yield from items
+        else:
+            futures = [pool.submit(solve_chunk, day, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
@@ -0,0 +1,186 @@
+import contextlib
+import json
+import math
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+
+@dataclass
+class BenchResult:
+    day: str
+    times: list[float]
+    peak_bytes: int
+    import_seconds: float | None = None
+
+    @property
+    def min(self):
+        return min(self.times)
+
+    @property
+    def median(self):
+        return statistics.median(self.times)
+
+    @property
+    def p95(self):
+        return percentile(self.times, 95)
+
+    def to_dict(self):
+        return {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "peak_bytes": self.peak_bytes,
+            "import_seconds": self.import_seconds,
+            "times": self.times,
+        }
+
+
+@dataclass
+class Comparison:
+    result: BenchResult
+    baseline_median: float | None
+    threshold: float
+
+    @property
+    def change(self):
+        if not self.baseline_median:
+            return None
+        return self.result.median / self.baseline_median - 1
+
+    @property
+    def regressed(self):
+        change = self.change
+        return change is not None and change > self.threshold
+
+
+def percentile(values: list[float], pct: float):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(rank, 1) - 1]
+
+
+@contextlib.contextmanager
+def quiet():
+    """Discard anything the solver prints while it is being measured"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def measure_time(func: Callable[[], Any]):
+    with quiet():
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+
+def measure_peak(func: Callable[[], Any]):
+    tracemalloc.start()
+    try:
+        with quiet():
+            func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench(day: str, func: Callable[[], Any], *, warmup: int, repeat: int):
+    for _ in range(warmup):
+        measure_time(func)
+    times = [measure_time(func) for _ in range(repeat)]
+    # tracemalloc slows everything down, so memory gets its own run
+    peak = measure_peak(func)
+    return BenchResult(day, times, peak)
+
+
+def save_baseline(path: Path, results: list[BenchResult], *, example: bool):
+    baseline = {
+        "python": platform.python_version(),
+        "example": example,
+        "days": {r.day: r.to_dict() for r in results},
+    }
+    path.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    return json.loads(path.read_text())["days"]
+
+
+def compare(
+    results: list[BenchResult],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+):
+    return [
+        Comparison(r, baseline.get(r.day, {}).get("median"), threshold) for r in results
+    ]
+
+
+def scaling_exponent(curve: list[tuple[int, float]]):
+    """Estimate k of O(n^k) from the first and last point of a time curve"""
+    (n1, t1), (n2, t2) = curve[0], curve[-1]
+    if n1 == n2 or not t1 or not t2:
+        return None
+    return math.log(t2 / t1) / math.log(n2 / n1)
+
+
+def format_scaling(curve: list[tuple[int, float]]):
+    exponent = scaling_exponent(curve)
+    if exponent is None:
+        return ""
+    return f"~O(n^{exponent:.2f}) from scale {curve[0][0]} to {curve[-1][0]}"
+
+
+def format_header(compare: bool = False):
+    header = f"{'day':>10} {'min':>10} {'median':>10} {'p95':>10} {'peak':>10}"
+    if compare:
+        header += f" {'change':>8}"
+    return header
+
+
+def format_result(result: BenchResult):
+    return (
+        f"{result.day:>10}"
+        f" {format_seconds(result.min):>10}"
+        f" {format_seconds(result.median):>10}"
+        f" {format_seconds(result.p95):>10}"
+        f" {format_bytes(result.peak_bytes):>10}"
+    )
+
+
+def format_import(seconds: float, budget: float):
+    line = f"{'':>10} import {format_seconds(seconds)}"
+    if seconds > budget:
+        line += f"  OVER BUDGET of {format_seconds(budget)}"
+    return line
+
+
+def format_comparison(c: Comparison):
+    line = format_result(c.result)
+    if c.change is None:
+        return line + f" {'new':>8}"
+    line += f" {c.change:>+8.1%}"
+    if c.regressed:
+        line += "  REGRESSION"
+    return line
+
+
+def format_seconds(seconds: float):
+    if seconds < 1:
+        return f"{seconds * 1000:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def format_bytes(size: float):
+    for unit in "B", "KiB", "MiB":
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import mmap
+import os
+import pickle
+from pathlib import Path
+from typing import Any
+
+from aoclib.inputs import Input
+
+DEFAULT_ROOT = Path(".aoc-cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_PARSED_MAX_BYTES = 256 * 1024 * 1024
+BUFFER_ALIGNMENT = 64
+
+# shared by the days, so changing them can change any day's answers
+SHARED_MODULES = ["aocgrid", "aoclib.ints"]
+
+
+def source_files(day: str):
+    files = list(Path(f"day{day}").glob("**/*.py"))
+    for module in SHARED_MODULES:
+        path = Path(*module.split("."))
+        if path.is_dir():
+            files.extend(path.glob("**/*.py"))
+        else:
+            files.append(path.with_suffix(".py"))
+    return sorted(files)
+
+
+def source_hash(day: str):
+    """Hash every python file of a day's package and the shared modules"""
+    h = hashlib.sha256()
+    for file in source_files(day):
+        h.update(file.as_posix().encode())
+        h.update(file.read_bytes())
+    return h.hexdigest()
+
+
+def input_hash(data: str | bytes):
+    if isinstance(data, str):
+        data = data.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(day: str, data: str | Input):
+    """Get the key of a day's input, or None if the input can't be hashed"""
+    if isinstance(data, Input):
+        digest = data.digest()
+        if digest is None:
+            return None
+    else:
+        digest = input_hash(data)
+    return f"day{day}-{source_hash(day)[:16]}-{digest[:32]}"
+
+
+class DiskCache:
+    """Entries of a day's input kept in a directory of ``root``.
+
+    Entries are keyed by the hash of the input and the hash of the day's
+    source, so editing either one misses the cache. An entry is one file per
+    suffix, and the least recently used entries are evicted once the cache
+    grows past ``max_bytes``.
+    """
+
+    name: str
+    suffixes: tuple[str, ...]
+
+    def __init__(self, root: Path = DEFAULT_ROOT, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root / self.name
+        self.max_bytes = max_bytes
+
+    def key(self, day: str, data: str | Input):
+        return cache_key(day, data)
+
+    def path(self, key: str, suffix: str | None = None):
+        return self.root / f"{key}{suffix or self.suffixes[0]}"
+
+    def write(self, path: Path, data: bytes | bytearray):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+
+    def evict(self):
+        # key -> [last access, total size]
+        entries: dict[str, list[float]] = {}
+        for path in self.root.iterdir():
+            if path.suffix not in self.suffixes:
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entry = entries.setdefault(path.stem, [0, 0])
+            entry[0] = max(entry[0], stat.st_mtime)
+            entry[1] += stat.st_size
+
+        total = sum(size for _, size in entries.values())
+        for key, (_, size) in sorted(entries.items(), key=lambda e: e[1][0]):
+            if total <= self.max_bytes:
+                break
+            for suffix in self.suffixes:
+                self.path(key, suffix).unlink(missing_ok=True)
+            total -= size
+
+
+class AnswerCache(DiskCache):
+    """On-disk cache of a day's answers"""
+
+    name = "answers"
+    suffixes = (".json",)
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        path = self.path(key)
+        try:
+            records = json.loads(path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # the mtime doubles as the last access time for eviction
+        path.touch()
+        return records
+
+    def put(self, key: str, records: list[dict[str, Any]]):
+        self.write(self.path(key), json.dumps(records).encode())
+        self.evict()
+
+
+class ParseCache(DiskCache):
+    """On-disk cache of what a day's ``parse`` hook returns.
+
+    The result is pickled, with large buffers such as numpy arrays kept out of
+    band in a ``.bin`` file. That file is memory mapped copy-on-write when the
+    entry is loaded, so arrays are paged in as they are used and can still be
+    modified by the parts.
+    """
+
+    name = "parsed"
+    suffixes = (".pkl", ".bin")
+
+    def __init__(
+        self, root: Path = DEFAULT_ROOT, max_bytes: int = DEFAULT_PARSED_MAX_BYTES
+    ):
+        super().__init__(root, max_bytes)
+
+    def get(self, key: str):
+        """Load a parsed input, or get None if it isn't cached"""
+        path = self.path(key, ".pkl")
+        try:
+            payload, spans = pickle.loads(path.read_bytes())
+            buffers = []
+            if spans:
+                with self.path(key, ".bin").open("rb") as f:
+                    view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+                buffers = [view[start:end] for start, end in spans]
+            parsed = pickle.loads(payload, buffers=buffers)
+        except (FileNotFoundError, ValueError, pickle.UnpicklingError):
+            return None
+        path.touch()
+        return parsed
+
+    def put(self, key: str, parsed: Any):
+        """Store a parsed input, unless it can't be pickled"""
+        buffers: list[pickle.PickleBuffer] = []
+        try:
+            payload = pickle.dumps(parsed, protocol=5, buffer_callback=buffers.append)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        spans = []
+        if buffers:
+            data = bytearray()
+            for buffer in buffers:
+                raw = buffer.raw()
+                # keep every buffer aligned for numpy
+                data.extend(bytes(-len(data) % BUFFER_ALIGNMENT))
+                spans.append((len(data), len(data) + raw.nbytes))
+                data.extend(raw)
+            self.write(self.path(key, ".bin"), data)
+        # the .pkl goes last, so a complete entry is never missing its .bin
+        self.write(self.path(key, ".pkl"), pickle.dumps((payload, spans)))
+        self.evict()
+        return True
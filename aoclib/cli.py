@@ -0,0 +1,414 @@
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import click
+import typer
+
+from aoclib.importtime import DEFAULT_BUDGET
+
+if TYPE_CHECKING:
+    from aoclib.cache import AnswerCache, ParseCache
+
+app = typer.Typer(no_args_is_help=True)
+
+
+python_template = """\
+def parse(data: str):
+    return data
+
+
+def part1(data):
+    pass
+
+
+def part2(data):
+    pass
+"""
+
+
+@app.command()
+def init(day: str):
+    """Create a new AOC challenge solution."""
+    day_root = Path(f"day{day}")
+    day_root.mkdir(exist_ok=True)
+
+    pyfile = "__init__.py"
+    paths = ["data.txt", "example.txt"]
+    for p in paths:
+        pth = day_root / p
+        pth.touch()
+
+    pyfilepth = day_root / pyfile
+    if not pyfilepth.exists():
+        pyfilepth.write_text(python_template)
+
+
+def discover_days(root: Path = Path()):
+    days = [p.parent.name.removeprefix("day") for p in root.glob("day*/__init__.py")]
+    return sorted((d for d in days if d.isdigit()), key=int)
+
+
+def getdata(day: str, *, example: bool, path: str | None = None):
+    from aoclib.inputs import Input
+
+    if path is not None:
+        data = Input.from_arg(path)
+    else:
+        data = Input.for_day(day, example=example)
+
+    if data.path is not None and not data.path.is_file():
+        raise click.FileError(str(data.path), "File does not exist")
+    return data
+
+
+@app.command()
+def run(
+    day: Optional[str] = typer.Argument(None),
+    example: bool = False,
+    all_days: bool = typer.Option(False, "--all", help="Run every day."),
+    days: Optional[str] = typer.Option(None, help="Comma separated days to run."),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Worker processes for --all/--days."
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Print one JSON record per part."
+    ),
+    memory: bool = typer.Option(
+        False, help="Measure the peak memory of each part. Slows down the run."
+    ),
+    progress: bool = typer.Option(False, help="Show progress of long running days."),
+    use_cache: bool = typer.Option(
+        True, "--cache/--no-cache", help="Reuse answers for unchanged inputs."
+    ),
+    refresh: bool = typer.Option(False, help="Recompute and overwrite cached answers."),
+    parse_cache: bool = typer.Option(
+        True, help="Reuse what parse returned for unchanged inputs."
+    ),
+    input_path: Optional[str] = typer.Option(
+        None, "--input", "-i", help="Read the input from a file, or - for stdin."
+    ),
+    daemon: bool = typer.Option(True, help="Use `aoc serve` when it is running."),
+):
+    """Run an aoc challenge"""
+    from aoclib.cache import AnswerCache, ParseCache
+
+    if progress:
+        import logging
+
+        logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    cache = AnswerCache() if use_cache else None
+    parsed = ParseCache() if parse_cache else None
+    if all_days or days:
+        if input_path is not None:
+            raise click.UsageError("--input can only be used with a single day.")
+        selected = discover_days() if all_days else parse_days(days or "")
+        return run_parallel(
+            selected,
+            example=example,
+            jobs=jobs,
+            json_output=json_output,
+            memory=memory,
+            cache=cache,
+            refresh=refresh,
+            parse_cache=parsed,
+        )
+    if day is None:
+        raise click.UsageError("Missing argument 'DAY'.")
+
+    from aoclib.runner import print_result, solve_cached
+
+    data = getdata(day, example=example, path=input_path)
+    if daemon and not (memory or progress):
+        from aoclib.daemon import run_remote
+
+        status = run_remote(
+            day,
+            example=example,
+            input_path=input_path,
+            json_output=json_output,
+            use_cache=use_cache,
+            refresh=refresh,
+            parse_cache=parse_cache,
+        )
+        if status is not None:
+            raise typer.Exit(status)
+
+    results = solve_cached(
+        day,
+        data,
+        cache=cache,
+        refresh=refresh,
+        trace_memory=memory,
+        parse_cache=parsed,
+    )
+    for result in results:
+        print_result(result, json_output=json_output)
+
+
+def parse_days(days: str):
+    return [d.strip() for d in days.split(",") if d.strip()]
+
+
+def run_parallel(
+    days: list[str],
+    *,
+    example: bool,
+    jobs: int | None,
+    json_output: bool,
+    memory: bool,
+    cache: "AnswerCache | None",
+    refresh: bool,
+    parse_cache: "ParseCache | None",
+):
+    from concurrent.futures import ProcessPoolExecutor
+
+    from aoclib.bench import format_seconds
+    from aoclib.runner import print_result, run_captured
+
+    datas = [getdata(day, example=example) for day in days]
+    failed = 0
+    with ProcessPoolExecutor(jobs) as pool:
+        # map yields in submission order, so days print in order as they finish
+        outputs = pool.map(
+            run_captured,
+            days,
+            datas,
+            [memory] * len(days),
+            [cache] * len(days),
+            [refresh] * len(days),
+            [parse_cache] * len(days),
+        )
+        for day_output in outputs:
+            if not json_output:
+                seconds = format_seconds(day_output.seconds)
+                typer.echo(f"Day {day_output.day} ({seconds})")
+                typer.echo(day_output.output, nl=False)
+            for result in day_output.results:
+                print_result(result, json_output=json_output)
+            if day_output.error:
+                failed += 1
+                typer.echo(day_output.error, err=True, nl=False)
+
+    if failed:
+        raise typer.Exit(1)
+
+
+@app.command()
+def bench(
+    days: Optional[list[str]] = typer.Argument(
+        None, help="Days to benchmark. Defaults to every day."
+    ),
+    example: bool = False,
+    warmup: int = typer.Option(1, min=0),
+    repeat: int = typer.Option(5, min=1),
+    output: Optional[Path] = typer.Option(
+        None, help="Write the results to a JSON baseline."
+    ),
+    compare: Optional[Path] = typer.Option(
+        None, exists=True, dir_okay=False, help="Baseline to compare against."
+    ),
+    threshold: float = typer.Option(
+        0.1, help="Median slowdown allowed before it counts as a regression."
+    ),
+    scale: Optional[list[int]] = typer.Option(
+        None, min=1, help="Benchmark generated inputs of this scale. Repeatable."
+    ),
+    seed: int = 0,
+    check_imports: bool = typer.Option(
+        False, help="Fail if a day's imports take longer than --import-budget."
+    ),
+    import_budget: float = typer.Option(
+        DEFAULT_BUDGET,
+        help="Seconds `aoc run` may spend on imports before running a day.",
+    ),
+    parse_cache: bool = typer.Option(
+        False, help="Load parsed inputs from the cache instead of parsing them."
+    ),
+):
+    """Benchmark aoc challenges"""
+    from aoclib import bench as b
+    from aoclib.importtime import day_import_time
+    from aoclib.cache import ParseCache
+    from aoclib.runner import solve
+
+    parsed = ParseCache() if parse_cache else None
+    baseline = b.load_baseline(compare) if compare else None
+    typer.echo(b.format_header(baseline is not None))
+
+    results: list[b.BenchResult] = []
+    regressions = 0
+    over_budget = 0
+    for day in days or discover_days():
+        if scale:
+            from aoclib.generate import generate_text
+            from aoclib.inputs import Input
+
+            inputs = [
+                (f"{day}@{s}", Input.from_text(generate_text(day, s, seed)))
+                for s in scale
+            ]
+        else:
+            inputs = [(day, getdata(day, example=example))]
+
+        for label, data in inputs:
+            result = b.bench(
+                label,
+                lambda: list(solve(day, data, parse_cache=parsed)),
+                warmup=warmup,
+                repeat=repeat,
+            )
+            results.append(result)
+            if baseline is None:
+                typer.echo(b.format_result(result))
+            else:
+                (comparison,) = b.compare([result], baseline, threshold)
+                regressions += comparison.regressed
+                typer.echo(b.format_comparison(comparison))
+
+        if scale and len(scale) > 1:
+            curve = [(s, r.median) for s, r in zip(scale, results[-len(scale) :])]
+            typer.echo(f"{'':>10} {b.format_scaling(curve)}")
+
+        if check_imports:
+            seconds = day_import_time(day)
+            for result in results[-len(inputs) :]:
+                result.import_seconds = seconds
+            over_budget += seconds > import_budget
+            typer.echo(b.format_import(seconds, import_budget))
+
+    if output:
+        b.save_baseline(output, results, example=example)
+    if regressions:
+        typer.echo(f"{regressions} regression(s) over {threshold:.0%}", err=True)
+    if over_budget:
+        typer.echo(f"{over_budget} day(s) over the import budget", err=True)
+    if regressions or over_budget:
+        raise typer.Exit(1)
+
+
+@app.command()
+def profile(
+    day: str,
+    example: bool = False,
+    input_path: Optional[str] = typer.Option(
+        None, "--input", "-i", help="Read the input from a file, or - for stdin."
+    ),
+    top: int = typer.Option(20, min=1, help="Number of entries to show."),
+    sort: str = typer.Option("cumulative", help="pstats sort key."),
+    dump: Optional[Path] = typer.Option(
+        None,
+        help="Write the pstats data to a .prof file, for snakeviz or flameprof.",
+    ),
+    memory: bool = typer.Option(
+        False, help="Show the top allocation sites with tracemalloc instead."
+    ),
+):
+    """Profile an aoc challenge"""
+    from aoclib import profiling
+    from aoclib.runner import print_result
+
+    data = getdata(day, example=example, path=input_path)
+    if memory:
+        results, phases, snapshot, peak = profiling.run_traced(day, data)
+        lines = profiling.format_allocations(snapshot, top)
+    else:
+        results, phases, stats = profiling.run_profiled(day, data)
+        lines = [profiling.format_stats(stats, top, sort)]
+        if dump:
+            stats.dump_stats(dump)
+
+    for result in results:
+        print_result(result)
+    typer.echo()
+    typer.echo("Phases:")
+    for line in profiling.format_phases(results, phases):
+        typer.echo(line)
+    typer.echo()
+    if memory:
+        from aoclib.bench import format_bytes
+
+        typer.echo(f"Peak memory: {format_bytes(peak)}")
+        typer.echo("Top allocations:")
+    for line in lines:
+        typer.echo(line)
+
+
+@app.command()
+def gen(
+    day: str,
+    scale: int = typer.Option(1000, min=1, help="Size of the input, see dayN/gen.py"),
+    seed: int = 0,
+    output: Optional[Path] = typer.Option(None, "--output", "-o"),
+):
+    """Generate a scaled input for an aoc challenge"""
+    from aoclib.generate import write_input
+
+    if output is None:
+        write_input(sys.stdout, day, scale, seed)
+    else:
+        with output.open("w") as f:
+            write_input(f, day, scale, seed)
+
+
+@app.command()
+def serve(
+    socket_path: Path = typer.Option(
+        Path(".aoc.sock"), "--socket", help="Unix socket to listen on."
+    ),
+):
+    """Keep days imported and inputs parsed for faster `aoc run`s"""
+    from aoclib.serve import serve
+
+    typer.echo(f"Listening on {socket_path}")
+    try:
+        serve(socket_path)
+    except RuntimeError as e:
+        raise click.ClickException(str(e))
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+def batch(
+    day: str,
+    inputs: list[Path] = typer.Argument(..., help="Input files to solve."),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Worker processes."
+    ),
+    chunk_size: Optional[int] = typer.Option(
+        None, min=1, help="Inputs sent to a worker at a time."
+    ),
+    ordered: bool = typer.Option(
+        True,
+        "--input-order/--completion-order",
+        help="Print results in the order of the inputs or as they finish.",
+    ),
+    json_output: bool = typer.Option(
+        False, "--json", help="Print one JSON record per input."
+    ),
+):
+    """Solve many inputs of an aoc challenge"""
+    import json
+
+    from aoclib.batch import DEFAULT_CHUNK_SIZE, run_batch
+
+    failed = 0
+    items = run_batch(
+        day,
+        map(str, inputs),
+        jobs=jobs,
+        chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+        ordered=ordered,
+    )
+    for item in items:
+        failed += item.error is not None
+        if json_output:
+            typer.echo(json.dumps(item.to_dict()))
+        else:
+            typer.echo(item.format())
+
+    if failed:
+        typer.echo(f"{failed} of {len(inputs)} input(s) failed", err=True)
+        raise typer.Exit(1)
@@ -0,0 +1,79 @@
+"""Client side of ``aoc serve``.
+
+Requests and replies are JSON, one message per line. A request names the day
+and its input, and the reply is a stream of ``{"result": ...}``,
+``{"output": ...}`` and ``{"error": ...}`` messages ending with
+``{"done": true}``.
+"""
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+from aoclib.runner import PartResult, print_result
+
+DEFAULT_SOCKET = Path(".aoc.sock")
+
+
+def connect(socket_path: Path = DEFAULT_SOCKET):
+    """Connect to a running server, or get None if there is none"""
+    if not socket_path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def send_request(sock: socket.socket, request: dict[str, Any]) -> Iterator[dict]:
+    with sock, sock.makefile("rwb") as f:
+        f.write(json.dumps(request).encode() + b"\n")
+        f.flush()
+        for line in f:
+            message = json.loads(line)
+            if message.get("done"):
+                return
+            yield message
+
+
+def run_remote(
+    day: str,
+    *,
+    example: bool = False,
+    input_path: str | None = None,
+    json_output: bool = False,
+    use_cache: bool = True,
+    refresh: bool = False,
+    parse_cache: bool = True,
+    socket_path: Path = DEFAULT_SOCKET,
+):
+    """Run a day on the server, and get the exit code or None without a server"""
+    if input_path == "-":
+        # stdin belongs to this process
+        return None
+    sock = connect(socket_path)
+    if sock is None:
+        return None
+
+    request = {
+        "day": day,
+        "example": example,
+        "input": str(Path(input_path).resolve()) if input_path else None,
+        "use_cache": use_cache,
+        "refresh": refresh,
+        "parse_cache": parse_cache,
+    }
+    status = 0
+    for message in send_request(sock, request):
+        if "output" in message:
+            sys.stdout.write(message["output"])
+        if "result" in message:
+            print_result(PartResult(**message["result"]), json_output=json_output)
+        if "error" in message:
+            sys.stderr.write(message["error"])
+            status = 1
+    return status
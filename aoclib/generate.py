@@ -0,0 +1,26 @@
+import importlib
+import random
+from typing import IO, Iterator, Protocol
+
+
+class Generator(Protocol):
+    def __call__(self, scale: int, rng: random.Random) -> Iterator[str]:
+        ...
+
+
+def get_generator(day: str) -> Generator:
+    """Get the input generator of a day, found in ``dayN/gen.py``"""
+    return importlib.import_module(f"day{day}.gen").generate
+
+
+def generate(day: str, scale: int, seed: int = 0) -> Iterator[str]:
+    """Generate the lines of a puzzle input for a day"""
+    return get_generator(day)(scale, random.Random(seed))
+
+
+def generate_text(day: str, scale: int, seed: int = 0):
+    return "".join(f"{line}\n" for line in generate(day, scale, seed))
+
+
+def write_input(out: IO[str], day: str, scale: int, seed: int = 0):
+    out.writelines(f"{line}\n" for line in generate(day, scale, seed))
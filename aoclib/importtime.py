@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+# what `aoc run DAY` imports before it gets to the day itself
+STARTUP_MODULES = ["aoc", "aoclib.cache", "aoclib.runner"]
+
+# numpy alone takes ~0.12s to import, and most days need it
+DEFAULT_BUDGET = 0.25
+
+
+def top_level_imports(code: str) -> dict[str, int]:
+    """Get the cumulative import time, in microseconds, of every module
+    imported at the top level while running ``code`` in a new interpreter"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        # nested imports are indented past the single leading space
+        if name.startswith("  "):
+            continue
+        times[name.strip()] = int(fields[1])
+    return times
+
+
+def import_time(modules: list[str]):
+    """Seconds spent importing ``modules``, not counting interpreter startup"""
+    startup = top_level_imports("pass")
+    imported = top_level_imports("import " + ", ".join(modules))
+    return sum(us for name, us in imported.items() if name not in startup) / 1e6
+
+
+def day_import_time(day: str):
+    return import_time([*STARTUP_MODULES, f"day{day}"])
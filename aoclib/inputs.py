@@ -0,0 +1,141 @@
+import contextlib
+import hashlib
+import io
+import mmap
+import sys
+from pathlib import Path
+from typing import IO, Callable, Iterator, TypeVar
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+F = TypeVar("F", bound=Callable)
+
+
+def streaming(func: F) -> F:
+    """Mark a parse hook or part as taking an :class:`Input` instead of a str"""
+    func.accepts_input = True  # type: ignore[attr-defined]
+    return func
+
+
+def accepts_input(func: Callable):
+    return getattr(func, "accepts_input", False)
+
+
+class Input:
+    """A puzzle input that can be consumed without reading it into one str.
+
+    The input is backed by a file, by stdin when ``path`` is None, or by an
+    in-memory buffer. Stdin can only be consumed once.
+    """
+
+    def __init__(self, path: Path | None = None, *, data: bytes | None = None):
+        self.path = path
+        self.data = data
+        self._text: str | None = None
+        self._digest: str | None = None
+
+    @classmethod
+    def from_arg(cls, arg: str):
+        """Create an input from a command line argument, where ``-`` is stdin"""
+        if arg == "-":
+            return cls()
+        return cls(Path(arg))
+
+    @classmethod
+    def for_day(cls, day: str, *, example: bool = False):
+        name = "data"
+        if example:
+            name = "example"
+        return cls(Path(f"day{day}/{name}.txt"))
+
+    @classmethod
+    def from_text(cls, text: str):
+        return cls(data=text.encode())
+
+    @property
+    def name(self):
+        if self.data is not None:
+            return "<memory>"
+        if self.path is None:
+            return "<stdin>"
+        return str(self.path)
+
+    @property
+    def is_stdin(self):
+        return self.path is None and self.data is None
+
+    @contextlib.contextmanager
+    def open(self) -> Iterator[IO[bytes]]:
+        if self.data is not None:
+            yield io.BytesIO(self.data)
+        elif self.path is not None:
+            with self.path.open("rb") as f:
+                yield f
+        else:
+            yield sys.stdin.buffer
+
+    @contextlib.contextmanager
+    def open_text(self) -> Iterator[IO[str]]:
+        if self.data is not None:
+            yield io.StringIO(self.data.decode())
+        elif self.path is not None:
+            with self.path.open() as f:
+                yield f
+        else:
+            yield sys.stdin
+
+    def text(self):
+        if self._text is None:
+            with self.open_text() as f:
+                self._text = f.read()
+        return self._text
+
+    def lines(self) -> Iterator[str]:
+        """Iterate over the lines, without their line endings"""
+        with self.open_text() as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+
+    def records(self) -> Iterator[list[str]]:
+        """Iterate over groups of lines separated by blank lines"""
+        record: list[str] = []
+        for line in self.lines():
+            if line:
+                record.append(line)
+            elif record:
+                yield record
+                record = []
+        if record:
+            yield record
+
+    def chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        with self.open() as f:
+            while chunk := f.read(size):
+                yield chunk
+
+    @contextlib.contextmanager
+    def buffer(self) -> Iterator[bytes | mmap.mmap]:
+        """Get the whole input as bytes, memory mapped if it is a file"""
+        if self.data is not None:
+            yield self.data
+        elif self.path is not None:
+            with self.path.open("rb") as f:
+                if self.path.stat().st_size == 0:
+                    yield b""
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    yield m
+        else:
+            self.data = sys.stdin.buffer.read()
+            yield self.data
+
+    def digest(self):
+        """Hash the input, or None for stdin which can't be read twice"""
+        if self.is_stdin:
+            return None
+        if self._digest is None:
+            h = hashlib.sha256()
+            for chunk in self.chunks():
+                h.update(chunk)
+            self._digest = h.hexdigest()
+        return self._digest
@@ -0,0 +1,95 @@
+from typing import Iterator
+
+import numpy as np
+
+from aoclib.inputs import Input
+
+# 10**18 is the largest power of ten that fits an int64
+POWERS = 10 ** np.arange(19, dtype=np.int64)
+
+# bytes scanned at a time. scan's temporaries take ~30 bytes per byte scanned,
+# so this keeps them to a few megabytes, and smaller chunks stay in cache
+CHUNK_SIZE = 256 * 1024
+
+
+def line_chunks(data: Input, size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read the input about ``size`` bytes at a time, cut after a newline so
+    that no number or sign is split between chunks"""
+    rest = b""
+    for chunk in data.chunks(size):
+        chunk = rest + chunk
+        cut = chunk.rfind(b"\n") + 1
+        if cut:
+            yield chunk[:cut]
+        rest = chunk[cut:]
+    if rest:
+        yield rest
+
+
+def scan(buf: np.ndarray):
+    """Get the integers in ``buf`` and where their first digits are"""
+    digit = (buf >= ord("0")) & (buf <= ord("9"))
+    edges = np.diff(digit.view(np.int8), prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    if not starts.size:
+        return np.zeros(0, dtype=np.int64), starts
+
+    lengths = ends - starts
+    if lengths.max() > len(POWERS) - 1:
+        raise ValueError("integers of more than 18 digits don't fit an int64")
+
+    # the place value of every digit, counted from the end of its number
+    positions = np.flatnonzero(digit)
+    place = np.repeat(ends - 1, lengths) - positions
+    values = (buf[positions] - ord("0")) * POWERS[place]
+    # values only holds digits, so every number starts where the last ended
+    ints = np.add.reduceat(values, np.cumsum(lengths) - lengths)
+
+    minus = np.zeros(starts.size, dtype=bool)
+    has_sign = starts > 0
+    minus[has_sign] = buf[starts[has_sign] - 1] == ord("-")
+    # a - between two numbers is a separator, not a sign
+    after_digit = starts > 1
+    after_digit[after_digit] = digit[starts[after_digit] - 2]
+    ints[minus & ~after_digit] *= -1
+    return ints, starts
+
+
+def extract_ints(
+    data: str | bytes | Input, fields: int | None = None, *, offsets: bool = False
+):
+    """Get every integer in the input as an ``int64`` array.
+
+    The input is read and scanned with numpy a few megabytes at a time,
+    instead of line by line. A ``-`` right before the digits makes the number
+    negative, unless it follows another number, so that ranges like ``2-4``
+    are two positive numbers. With ``fields``, the array is reshaped to one
+    row of that many numbers per record. With ``offsets``, the byte offset of
+    every number's first digit is returned too. An input without any integers
+    is rejected, as it can't be what the day expects.
+    """
+    if not isinstance(data, Input):
+        data = Input(data=data.encode() if isinstance(data, str) else data)
+
+    all_ints = [np.zeros(0, dtype=np.int64)]
+    all_starts = [np.zeros(0, dtype=np.intp)]
+    offset = 0
+    for chunk in line_chunks(data, CHUNK_SIZE):
+        ints, starts = scan(np.frombuffer(chunk, dtype=np.uint8))
+        all_ints.append(ints)
+        all_starts.append(starts + offset)
+        offset += len(chunk)
+
+    ints = np.concatenate(all_ints)
+    if not ints.size:
+        raise ValueError("found no integers in the input")
+    if fields is not None:
+        if ints.size % fields:
+            raise ValueError(
+                f"found {ints.size} integers, which isn't a multiple of {fields}"
+            )
+        ints = ints.reshape(-1, fields)
+    if offsets:
+        return ints, np.concatenate(all_starts)
+    return ints
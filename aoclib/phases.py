@@ -0,0 +1,34 @@
+import contextlib
+import time
+from typing import Iterator
+
+_timings: dict[str, float] | None = None
+
+
+@contextlib.contextmanager
+def phase(name: str):
+    """Time a section of a solver, for the phase report of ``aoc profile``.
+
+    Does nothing unless phases are being recorded, so it is cheap to leave in.
+    Time spent in a phase that is entered several times adds up.
+    """
+    timings = _timings
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0) + time.perf_counter() - start
+
+
+@contextlib.contextmanager
+def record_phases() -> Iterator[dict[str, float]]:
+    global _timings
+    previous = _timings
+    _timings = {}
+    try:
+        yield _timings
+    finally:
+        _timings = previous
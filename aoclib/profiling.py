@@ -0,0 +1,83 @@
+import cProfile
+import importlib
+import io
+import pstats
+import tracemalloc
+
+from aoclib.inputs import Input
+from aoclib.phases import record_phases
+from aoclib.runner import PartResult, solve
+
+
+def run_profiled(day: str, data: str | Input):
+    # keep the import out of the profile
+    importlib.import_module(f"day{day}")
+    profiler = cProfile.Profile()
+    with record_phases() as phases:
+        profiler.enable()
+        try:
+            results = list(solve(day, data))
+        finally:
+            profiler.disable()
+    return results, phases, pstats.Stats(profiler)
+
+
+def run_traced(day: str, data: str | Input, frames: int = 1):
+    importlib.import_module(f"day{day}")
+    results = []
+    snapshot = None
+    largest = -1
+    tracemalloc.start(frames)
+    try:
+        with record_phases() as phases:
+            # the parsed input is still alive between parts, so keep the
+            # snapshot from whenever the most memory was in use
+            for result in solve(day, data):
+                results.append(result)
+                current, _ = tracemalloc.get_traced_memory()
+                if current > largest:
+                    snapshot = tracemalloc.take_snapshot()
+                    largest = current
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert snapshot is not None
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+        ]
+    )
+    return results, phases, snapshot, peak
+
+
+def format_phases(results: list[PartResult], phases: dict[str, float]):
+    from aoclib.bench import format_seconds
+
+    lines = []
+    for r in results:
+        name = "parse" if r.part == "parse" else f"part {r.part}"
+        lines.append(f"{name:>20} {format_seconds(r.seconds):>10}")
+    for name, seconds in phases.items():
+        lines.append(f"{name:>20} {format_seconds(seconds):>10}")
+    return lines
+
+
+def format_stats(stats: pstats.Stats, top: int, sort: str):
+    out = io.StringIO()
+    stats.stream = out  # type: ignore[attr-defined]
+    stats.sort_stats(sort).print_stats(top)
+    return out.getvalue()
+
+
+def format_allocations(snapshot: tracemalloc.Snapshot, top: int):
+    from aoclib.bench import format_bytes
+
+    lines = []
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{format_bytes(stat.size):>10} {stat.count:>8} blocks"
+            f"  {frame.filename}:{frame.lineno}"
+        )
+    return lines
@@ -0,0 +1,233 @@
+import contextlib
+import importlib
+import io
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Protocol
+
+from aoclib.inputs import Input, accepts_input
+
+if TYPE_CHECKING:
+    from aoclib.cache import AnswerCache, ParseCache
+
+
+@dataclass
+class PartResult:
+    day: str
+    part: int | str
+    answer: Any
+    seconds: float
+    peak_bytes: int | None = None
+    cached: bool = False
+
+    def to_dict(self):
+        return asdict(self)
+
+
+@dataclass
+class DayOutput:
+    day: str
+    results: list[PartResult] = field(default_factory=list)
+    output: str = ""
+    seconds: float = 0
+    error: str | None = None
+
+
+def get_parts(module: ModuleType) -> list[tuple[int | str, Callable[[Any], Any]]]:
+    """Get the part callables of a day.
+
+    Days expose ``part1`` and ``part2``, which are given the result of the
+    optional ``parse`` hook. Days that only have a ``main`` are run as a single
+    part whose answer is whatever ``main`` returns.
+    """
+    parts = [(n, func) for n in (1, 2) if (func := getattr(module, f"part{n}", None))]
+    if not parts and hasattr(module, "main"):
+        parts = [("main", module.main)]
+    return parts
+
+
+def normalize(answer: Any):
+    # numpy scalars are not json serializable
+    if getattr(answer, "shape", None) == ():
+        return answer.item()
+    return answer
+
+
+def timed(func: Callable[[Any], Any], arg: Any):
+    start = time.perf_counter()
+    answer = func(arg)
+    return answer, time.perf_counter() - start
+
+
+def measure(func: Callable[[Any], Any], arg: Any, *, trace_memory: bool):
+    if not trace_memory:
+        answer, seconds = timed(func, arg)
+        return normalize(answer), seconds, None
+
+    # imported here to keep it off the startup path of `aoc run`
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        answer, seconds = timed(func, arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return normalize(answer), seconds, peak
+
+
+def prepare(func: Callable, data: Any):
+    """Convert the input to what a hook accepts, either an Input or a str"""
+    if isinstance(data, Input) and not accepts_input(func):
+        return data.text()
+    if isinstance(data, str) and accepts_input(func):
+        return Input.from_text(data)
+    return data
+
+
+def parse_input(
+    day: str,
+    module: ModuleType,
+    data: str | Input,
+    *,
+    trace_memory: bool = False,
+    parse_cache: "ParseCache | None" = None,
+) -> tuple[Any, PartResult | None]:
+    parse = getattr(module, "parse", None)
+    if parse is None:
+        return data, None
+
+    key = parse_cache.key(day, data) if parse_cache is not None else None
+    if key is not None:
+        start = time.perf_counter()
+        parsed = parse_cache.get(key)
+        if parsed is not None:
+            seconds = time.perf_counter() - start
+            return parsed, PartResult(day, "parse", None, seconds, cached=True)
+
+    parsed, seconds, peak = measure(
+        parse, prepare(parse, data), trace_memory=trace_memory
+    )
+    if key is not None:
+        # stored before the parts get a chance to modify it
+        parse_cache.put(key, parsed)
+    return parsed, PartResult(day, "parse", None, seconds, peak)
+
+
+def solve_parts(
+    day: str, module: ModuleType, data: Any, *, trace_memory: bool = False
+) -> Iterator[PartResult]:
+    for part, func in get_parts(module):
+        answer, seconds, peak = measure(
+            func, prepare(func, data), trace_memory=trace_memory
+        )
+        yield PartResult(day, part, answer, seconds, peak)
+
+
+def solve(
+    day: str,
+    data: str | Input,
+    *,
+    trace_memory: bool = False,
+    parse_cache: "ParseCache | None" = None,
+) -> Iterator[PartResult]:
+    module = importlib.import_module(f"day{day}")
+    data, result = parse_input(
+        day, module, data, trace_memory=trace_memory, parse_cache=parse_cache
+    )
+    if result is not None:
+        yield result
+    yield from solve_parts(day, module, data, trace_memory=trace_memory)
+
+
+class Solver(Protocol):
+    def __call__(
+        self,
+        day: str,
+        data: str | Input,
+        *,
+        trace_memory: bool = False,
+        parse_cache: "ParseCache | None" = None,
+    ) -> Iterator[PartResult]:
+        ...
+
+
+def solve_cached(
+    day: str,
+    data: str | Input,
+    *,
+    cache: "AnswerCache | None",
+    refresh: bool = False,
+    trace_memory: bool = False,
+    parse_cache: "ParseCache | None" = None,
+    solver: Solver = solve,
+) -> Iterator[PartResult]:
+    key = cache.key(day, data) if cache is not None else None
+    if cache is None or key is None:
+        yield from solver(day, data, trace_memory=trace_memory, parse_cache=parse_cache)
+        return
+
+    if not refresh and (records := cache.get(key)) is not None:
+        for record in records:
+            yield PartResult(**{**record, "cached": True})
+        return
+
+    results = []
+    for result in solver(day, data, trace_memory=trace_memory, parse_cache=parse_cache):
+        results.append(result)
+        yield result
+    cache.put(key, [r.to_dict() for r in results])
+
+
+def format_result(result: PartResult):
+    if result.part == "parse" or result.answer is None:
+        return None
+    answer = str(result.answer)
+    if "\n" in answer:
+        answer = "\n" + answer
+    else:
+        answer = " " + answer
+    if result.part == "main":
+        return answer.lstrip(" ")
+    return f"Part {result.part}:{answer}"
+
+
+def print_result(result: PartResult, *, json_output: bool = False):
+    if json_output:
+        print(json.dumps(result.to_dict()))
+    elif (text := format_result(result)) is not None:
+        print(text)
+
+
+def run_captured(
+    day: str,
+    data: str | Input,
+    trace_memory: bool = False,
+    cache: "AnswerCache | None" = None,
+    refresh: bool = False,
+    parse_cache: "ParseCache | None" = None,
+):
+    """Run a day with its stdout captured, so it can be run in a worker process"""
+    out = io.StringIO()
+    day_output = DayOutput(day)
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(out):
+            results = solve_cached(
+                day,
+                data,
+                cache=cache,
+                refresh=refresh,
+                trace_memory=trace_memory,
+                parse_cache=parse_cache,
+            )
+            day_output.results.extend(results)
+    except Exception:
+        import traceback
+
+        day_output.error = traceback.format_exc()
+    day_output.seconds = time.perf_counter() - start
+    day_output.output = out.getvalue()
+    return day_output
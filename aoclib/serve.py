@@ -0,0 +1,170 @@
+import contextlib
+import dataclasses
+import importlib
+import io
+import json
+import signal
+import socketserver
+import sys
+import traceback
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator
+
+from aoclib.cache import SHARED_MODULES, AnswerCache, ParseCache, source_files
+from aoclib.daemon import DEFAULT_SOCKET, connect
+from aoclib.inputs import Input
+from aoclib.runner import PartResult, parse_input, solve_cached, solve_parts
+
+
+def source_signature(day: str):
+    return tuple((p.as_posix(), p.stat().st_mtime_ns) for p in source_files(day))
+
+
+def input_signature(path: Path):
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def unload(day: str):
+    modules = [f"day{day}", *SHARED_MODULES]
+    for name in list(sys.modules):
+        if any(name == m or name.startswith(f"{m}.") for m in modules):
+            del sys.modules[name]
+
+
+@dataclass
+class ParsedInput:
+    signature: tuple[int, int]
+    data: Any
+    result: PartResult | None
+
+
+@dataclass
+class LoadedDay:
+    module: ModuleType
+    signature: tuple
+    inputs: dict[Path, ParsedInput] = field(default_factory=dict)
+
+
+class WarmSolver:
+    """Keeps imported days and their parsed inputs between runs.
+
+    The source and input files are checked on every run. A day is only
+    reimported when its source changed, which also drops its parsed inputs,
+    and an input is only parsed again when it changed.
+    """
+
+    def __init__(self):
+        self.days: dict[str, LoadedDay] = {}
+
+    def load(self, day: str):
+        signature = source_signature(day)
+        loaded = self.days.get(day)
+        if loaded is None or loaded.signature != signature:
+            unload(day)
+            module = importlib.import_module(f"day{day}")
+            loaded = self.days[day] = LoadedDay(module, signature)
+        return loaded
+
+    def __call__(
+        self,
+        day: str,
+        data: str | Input,
+        *,
+        trace_memory: bool = False,
+        parse_cache: ParseCache | None = None,
+    ) -> Iterator[PartResult]:
+        loaded = self.load(day)
+        if not isinstance(data, Input) or data.path is None:
+            raise ValueError("only inputs read from files can be kept")
+
+        path = data.path.resolve()
+        signature = input_signature(path)
+        parsed = loaded.inputs.get(path)
+        if parsed is None or parsed.signature != signature:
+            parsed = ParsedInput(
+                signature,
+                *parse_input(
+                    day,
+                    loaded.module,
+                    data,
+                    trace_memory=trace_memory,
+                    parse_cache=parse_cache,
+                ),
+            )
+            loaded.inputs[path] = parsed
+        elif parsed.result is not None:
+            parsed.result = dataclasses.replace(parsed.result, cached=True)
+
+        if parsed.result is not None:
+            yield parsed.result
+        yield from solve_parts(
+            day, loaded.module, parsed.data, trace_memory=trace_memory
+        )
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    server: "SolverServer"
+
+    def send(self, message: dict[str, Any]):
+        self.wfile.write(json.dumps(message).encode() + b"\n")
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            for message in self.server.run(request):
+                self.send(message)
+        except Exception:
+            self.send({"error": traceback.format_exc()})
+        self.send({"done": True})
+
+
+class SolverServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path):
+        super().__init__(str(socket_path), RequestHandler)
+        self.solver = WarmSolver()
+
+    def run(self, request: dict[str, Any]):
+        day = request["day"]
+        if request.get("input"):
+            data = Input(Path(request["input"]))
+        else:
+            data = Input.for_day(day, example=request.get("example", False))
+        cache = AnswerCache() if request.get("use_cache", True) else None
+        parse_cache = ParseCache() if request.get("parse_cache", True) else None
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            results = list(
+                solve_cached(
+                    day,
+                    data,
+                    cache=cache,
+                    refresh=request.get("refresh", False),
+                    parse_cache=parse_cache,
+                    solver=self.solver,
+                )
+            )
+        if out.getvalue():
+            yield {"output": out.getvalue()}
+        for result in results:
+            yield {"result": result.to_dict()}
+
+
+def serve(socket_path: Path = DEFAULT_SOCKET):
+    if socket_path.exists():
+        if (sock := connect(socket_path)) is not None:
+            sock.close()
+            raise RuntimeError(f"a server is already listening on {socket_path}")
+        # left behind by a server that didn't shut down cleanly
+        socket_path.unlink()
+
+    # let `kill` run the cleanup below too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    with SolverServer(socket_path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
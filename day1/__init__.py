@@ -1,8 +1,65 @@
-def main(data: str):
-    elves = [sect.splitlines() for sect in data.split("\n\n")]
-    calories = [sum(map(int, elf)) for elf in elves]
-
-    # part 1
-    print(max(calories))
-    # part 2
-    print(sum(sorted(calories)[-3:]))
+import heapq
+from typing import TYPE_CHECKING, Iterator
+
+from aoclib.inputs import Input, streaming
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# how many of the elves carrying the most calories part 2 adds up
+TOP = 3
+
+
+def stream_totals(data: Input) -> Iterator[int]:
+    """Sum the calories of each elf while reading the input"""
+    total = None
+    for line in data.lines():
+        if line:
+            total = (total or 0) + int(line)
+        elif total is not None:
+            yield total
+            total = None
+    if total is not None:
+        yield total
+
+
+def bulk_totals(data: bytes) -> "np.ndarray":
+    """Sum the calories of each elf of an input that is already in memory"""
+    # numpy takes longer to import than a file takes to stream, so only the
+    # in-memory path pays for it
+    import numpy as np
+
+    from aoclib.ints import extract_ints
+
+    calories, starts = extract_ints(data, offsets=True)
+    buf = np.frombuffer(data, dtype=np.uint8)
+    blank_lines = np.flatnonzero((buf[:-1] == ord("\n")) & (buf[1:] == ord("\n")))
+    elf = np.searchsorted(blank_lines, starts)
+    firsts = np.flatnonzero(np.diff(elf, prepend=-1))
+    return np.add.reduceat(calories, firsts)
+
+
+def top_totals(data: Input, k: int) -> list[int]:
+    """Get the ``k`` largest totals, largest first"""
+    if data.data is not None:
+        totals = bulk_totals(data.data)
+        if not totals.size:
+            return []
+        k = min(k, totals.size)
+        top = totals[totals.argpartition(totals.size - k)[totals.size - k :]]
+        return sorted(top.tolist(), reverse=True)
+    # nlargest only ever keeps k totals around
+    return heapq.nlargest(k, stream_totals(data))
+
+
+@streaming
+def parse(data: Input):
+    return top_totals(data, TOP)
+
+
+def part1(top: list[int]):
+    return top[0]
+
+
+def part2(top: list[int]):
+    return sum(top[:TOP])
@@ -0,0 +1,11 @@
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` elves carrying up to 15 snacks each"""
+    for i in range(scale):
+        if i:
+            yield ""
+        for _ in range(rng.randint(1, 15)):
+            yield str(rng.randint(1000, 70000))
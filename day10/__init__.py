@@ -1,4 +1,6 @@
-from typing import Iterator
+from typing import Iterable, Iterator
+
+from aoclib.inputs import Input, streaming
 
 
 class CPU:
@@ -44,15 +46,18 @@ class CPU:
         return "\n".join("".join(row) for row in self.rendered_rows)
 
 
-def parse_opcodes(data: str):
-    for line in data.splitlines():
+Code = list[tuple[str, list[int]]]
+
+
+def parse_opcodes(lines: Iterable[str]):
+    for line in lines:
         opcode, *args = line.split()
         args = [*map(int, args)]
         yield opcode, args
 
 
-def main(data: str):
-    cpu = CPU(parse_opcodes(data))
+def run_cpu(code: Code):
+    cpu = CPU(code)
     signals = []
     for _ in cpu.operations():
         cpu.render_tick()
@@ -61,9 +66,20 @@ def main(data: str):
         if cpu.cycles in (20, 60, 100, 140, 180, 220):
             signals.append(cpu.signal_strength)
             # print(cpu.cycles, cpu.registers["X"], cpu.signal_strength)
+    return cpu, signals
+
+
+@streaming
+def parse(data: Input) -> Code:
+    return list(parse_opcodes(data.lines()))
+
+
+def part1(code: Code):
+    _, signals = run_cpu(code)
+    return sum(signals)
 
-    print("Part 1:", sum(signals))
 
-    print("Part 2:")
-    print(cpu.render_crt())
+def part2(code: Code):
+    cpu, _ = run_cpu(code)
     # print(cpu.rendered_row)
+    return cpu.render_crt()
@@ -0,0 +1,17 @@
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` instructions"""
+    x = 1
+    for _ in range(scale):
+        if rng.random() < 0.3:
+            yield "noop"
+        else:
+            # keep the sprite around the screen
+            value = rng.randint(-10, 10)
+            if not 0 <= x + value < 40:
+                value = -value
+            x += value
+            yield f"addx {value}"
@@ -1,8 +1,11 @@
+import logging
 from math import prod
 from operator import add, mul
 
 import numpy as np
 
+log = logging.getLogger(__name__)
+
 
 class Operation:
     def __init__(self, data: str) -> None:
@@ -67,34 +70,36 @@ def keep_away_round(monkeys: list[Monkey], *, relief: int | None = None):
             monkeys[next_monkey].items = items
 
 
-def keep_away(monkeys: list[Monkey]):
-    # part 1
+def monkey_business(monkeys: list[Monkey]):
+    two_most_active_monkeys = sorted(m.inspected for m in monkeys)[-2:]
+    return prod(two_most_active_monkeys)
+
+
+def part1(monkeys: list[Monkey]):
+    for m in monkeys:
+        m.reset()
+
     for _ in range(20):
         keep_away_round(monkeys)
 
-    two_most_active_monkeys = sorted(m.inspected for m in monkeys)[-2:]
-    monkey_business_level = prod(two_most_active_monkeys)
+    return monkey_business(monkeys)
 
-    print("Part 1:", monkey_business_level)
 
+def part2(monkeys: list[Monkey]):
     for m in monkeys:
         m.reset()
 
-    # part 2
-
     relief = prod(m.tests.test_value for m in monkeys)
     for _ in range(1, 10_001):
         keep_away_round(monkeys, relief=relief)
-        print(f"\r{f'{_/10000:.2%}':>7}", end="")
         if _ in (1, 20, 1000, 2000, 3000, 4000, 5000, 6000, 7000, 8000, 9000, 10000):
-            print(f"{_:6}", np.array([m.inspected for m in monkeys]))
+            inspected = np.array([m.inspected for m in monkeys])
+            log.info("%7.2f%% %6d %s", _ / 100, _, inspected)
 
-    two_most_active_monkeys = sorted(m.inspected for m in monkeys)[-2:]
-    monkey_business_level = prod(two_most_active_monkeys)
-    print("Part 2:", monkey_business_level)
+    return monkey_business(monkeys)
 
 
-def main(data: str):
+def parse(data: str):
     monkeys = []
     lines = iter(data.splitlines())
     while True:
@@ -124,4 +129,4 @@ def main(data: str):
             break
 
     # print("\n".join(f"{i}: {m.items}" for i, m in enumerate(monkeys)))
-    keep_away(monkeys)
+    return monkeys
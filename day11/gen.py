@@ -0,0 +1,31 @@
+import random
+from typing import Iterator
+
+DIVISORS = [2, 3, 5, 7, 11, 13, 17, 19]
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """8 monkeys holding ``scale`` items between them"""
+    monkeys = len(DIVISORS)
+    divisors = rng.sample(DIVISORS, monkeys)
+    counts = [1] * monkeys
+    for _ in range(max(scale, monkeys) - monkeys):
+        counts[rng.randrange(monkeys)] += 1
+
+    for i in range(monkeys):
+        if i:
+            yield ""
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(counts[i]))
+        # part 1 has no modulo, so keep the worry levels from overflowing
+        if rng.random() < 0.5:
+            operation = f"old * {rng.randint(2, 3)}"
+        else:
+            operation = f"old + {rng.randint(1, 8)}"
+        if_true, if_false = rng.sample([m for m in range(monkeys) if m != i], 2)
+
+        yield f"Monkey {i}:"
+        yield f"  Starting items: {items}"
+        yield f"  Operation: new = {operation}"
+        yield f"  Test: divisible by {divisors[i]}"
+        yield f"    If true: throw to monkey {if_true}"
+        yield f"    If false: throw to monkey {if_false}"
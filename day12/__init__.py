@@ -4,6 +4,8 @@ from typing import NamedTuple
 import numpy as np
 import string
 
+import aocgrid
+
 
 def get_height(s: str):
     match s:
@@ -119,22 +121,21 @@ class PathFinder:
         return new_location
 
 
+heights = aocgrid.byte_table(
+    {c: get_height(c) for c in string.ascii_lowercase + "SE"}, dtype="int16"
+)
+
+
 class HeightMap:
     def __init__(self, data: str):
-        self.grid = np.array(
-            [[get_height(c) for c in line] for line in data.splitlines()]
-        )
+        chars = aocgrid.parse_grid(data)
+        self.grid = heights[chars]
         self.visited: set[Position] = set()
-        line_length = data.index("\n") + 1
 
-        start_pos = data.index("S")
-        start_x = start_pos % line_length
-        start_y = start_pos // line_length
+        start_y, start_x = aocgrid.find(chars, ord("S"))
         self.start_pos = Position(start_x, start_y)
 
-        end_pos = data.index("E")
-        end_x = end_pos % line_length
-        end_y = end_pos // line_length
+        end_y, end_x = aocgrid.find(chars, ord("E"))
         self.end_pos = Position(end_x, end_y)
 
     def find_all_positions_of(self, height: int) -> list[Position]:
@@ -155,24 +156,55 @@ class HeightMap:
         pf = PathFinder(self.grid, start_pos, targets, reverse, set())
         return pf.find_shortest_path()
 
+    def count_steps(
+        self, start_pos: Position, targets: np.ndarray, *, reverse: bool = False
+    ):
+        """Breadth first search like find_shortest_path, but a whole step at a
+        time over flat indices. ``targets`` is a boolean mask of the grid."""
+        shape = self.grid.shape
+        flat = self.grid.ravel()
+        targets = targets.ravel()
+        visited = np.zeros(flat.size, dtype=bool)
+
+        frontier = np.array([aocgrid.flat_index(shape, start_pos.y, start_pos.x)])
+        visited[frontier] = True
+        steps = 0
+        while frontier.size:
+            if targets[frontier].any():
+                return steps
+            steps += 1
+            nbrs, valid = aocgrid.neighbours(shape, frontier)
+            climb = flat[nbrs] - flat[frontier][:, None]
+            valid &= climb >= -1 if reverse else climb <= 1
+            frontier = np.unique(nbrs[valid])
+            frontier = frontier[~visited[frontier]]
+            visited[frontier] = True
+        return None
+
     def part_1(self):
-        path = self.find_shortest_path()
-        if path is None:
+        targets = np.zeros(self.grid.shape, dtype=bool)
+        targets[self.end_pos.y, self.end_pos.x] = True
+        steps = self.count_steps(self.start_pos, targets)
+        if steps is None:
             return "No path found"
         else:
-            return len(path)
+            return steps
 
     def part_2(self):
-        targets = self.find_all_positions_of(0)
-        start_pos = self.end_pos
-        path = self.find_shortest_path(start_pos, targets, reverse=True)
-        if path is None:
+        steps = self.count_steps(self.end_pos, self.grid == 0, reverse=True)
+        if steps is None:
             return "No path found"
         else:
-            return len(path)
+            return steps
+
+
+def parse(data: str):
+    return HeightMap(data)
+
+
+def part1(hm: HeightMap):
+    return hm.part_1()
 
 
-def main(data: str):
-    hm = HeightMap(data)
-    print("Part 1:", hm.part_1())
-    print("Part 2:", hm.part_2())
+def part2(hm: HeightMap):
+    return hm.part_2()
@@ -0,0 +1,22 @@
+import random
+import string
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A height map ``scale`` wide and a quarter as high, climbing to the east"""
+    width = max(scale, 26)
+    height = max(5, width // 4)
+    # this row climbs at most one step at a time, so there is always a path
+    path_row = rng.randrange(height)
+    for y in range(height):
+        row = []
+        for x in range(width):
+            base = x * 26 // width
+            if y != path_row:
+                base = max(0, base - rng.randint(0, 3))
+            row.append(string.ascii_lowercase[base])
+        if y == path_row:
+            row[0] = "S"
+            row[-1] = "E"
+        yield "".join(row)
@@ -58,10 +58,15 @@ def find_divider_indicies(packets: list[Packet], dividers: list[Packet]):
     return [i for i, p in enumerate(packets, start=1) if p in dividers]
 
 
-def main(data: str):
-    packets = list(read_packets(data))
-    print("Part 1:", sum(compare_packets(packets)))
+def parse(data: str):
+    return list(read_packets(data))
 
+
+def part1(packets: list[PacketPair]):
+    return sum(compare_packets(packets))
+
+
+def part2(packets: list[PacketPair]):
     divider_packets: list[Packet] = [
         [[2]],
         [[6]],
@@ -72,4 +77,4 @@ def main(data: str):
     sorted_packets = sort_packets(all_packets)
 
     i1, i2 = find_divider_indicies(sorted_packets, divider_packets)
-    print("Part 2:", i1 * i2)
+    return i1 * i2
@@ -0,0 +1,28 @@
+import random
+from typing import Iterator
+
+from day13 import Packet
+
+DIVIDERS = [[[2]], [[6]]]
+
+
+def packet(rng: random.Random, depth: int = 0) -> list[Packet]:
+    items: list[Packet] = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(packet(rng, depth + 1))
+        else:
+            items.append(rng.randint(0, 10))
+    return items
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` pairs of packets"""
+    for i in range(scale):
+        if i:
+            yield ""
+        for _ in range(2):
+            # the divider packets can't be in the input
+            while (p := packet(rng)) in DIVIDERS:
+                pass
+            yield str(p).replace(" ", "")
@@ -2,6 +2,11 @@ from enum import Enum, auto
 from itertools import pairwise
 from typing import NamedTuple
 
+import numpy as np
+
+import aocgrid
+from aoclib.phases import phase
+
 
 class Position(NamedTuple):
     x: int
@@ -16,24 +21,32 @@ class Tile(Enum):
     SAND = auto()
 
 
-class FloorDict(dict[Position, Tile]):
-    def __init__(self, d: dict[Position, Tile], floor_y):
+class FloorDict(dict[int, Tile]):
+    """Tiles keyed by packed coordinates, with rock all along ``floor_y``"""
+
+    def __init__(self, d: dict[int, Tile], floor_y):
         super().__init__(d)
         self.floor_y = floor_y
+        # keys sort by row first, so everything from here on is floor or below
+        self.floor_key = aocgrid.row_start(floor_y)
 
-    def __getitem__(self, __key: Position) -> Tile:
-        if __key.y == self.floor_y:
+    def __getitem__(self, __key: int) -> Tile:
+        if __key >= self.floor_key:
             return Tile.ROCK
         return super().__getitem__(__key)
 
-    def __contains__(self, __o: Position) -> bool:
-        if __o.y == self.floor_y:
+    def __contains__(self, __o: int) -> bool:
+        if __o >= self.floor_key:
             return True
         return super().__contains__(__o)
 
 
+# where sand tries to fall, in order
+FALL = [aocgrid.offset(0, 1), aocgrid.offset(-1, 1), aocgrid.offset(1, 1)]
+
+
 class Grid:
-    sand_entry_position = Position(500, 0)
+    sand_entry_position = aocgrid.pack(500, 0)
 
     def __init__(self, rocks: list[list[Position]]):
         grid = {}
@@ -42,20 +55,24 @@ class Grid:
             for step1, step2 in pairwise(line):
                 if step1.x == step2.x:
                     for y in nrange(step1.y, step2.y):
-                        grid[Position(step1.x, y)] = Tile.ROCK
+                        grid[aocgrid.pack(step1.x, y)] = Tile.ROCK
                 if step1.y == step2.y:
                     for x in nrange(step1.x, step2.x):
-                        grid[Position(x, step1.y)] = Tile.ROCK
+                        grid[aocgrid.pack(x, step1.y)] = Tile.ROCK
 
-        floor_y = max(p.y for p in grid) + 2
+        self.lowest_rock = lowest_rocks(grid)
+        floor_y = max(self.lowest_rock.values()) + 2
         self.grid = FloorDict(grid, floor_y)
 
     def get_tiles(self, tile: Tile):
         return [k for k, v in self.grid.items() if v is tile]
 
-    def is_in_bottomless_pit(self, pos: Position):
-        same_x = [p.y for p in self.grid.keys() if p.x == pos.x]
-        return not bool(same_x) or max(same_x) < pos.y
+    def is_in_bottomless_pit(self, pos: int):
+        # sand only comes to rest above a rock in its own column, so the
+        # lowest rock is also the lowest tile
+        x, y = aocgrid.unpack(pos)
+        lowest = self.lowest_rock.get(x)
+        return lowest is None or lowest < y
 
     def drop_sand(self, *, until_blocked=False):
         sand_pos = self.sand_entry_position
@@ -63,10 +80,11 @@ class Grid:
         if self.sand_entry_position in self.grid:
             return False
 
+        grid = self.grid
         while True:
-            for x in 0, -1, 1:
-                pos = sand_pos.add(x, 1)
-                if pos not in self.grid and pos.add(0, -1):
+            for step in FALL:
+                pos = sand_pos + step
+                if pos not in grid:
                     if not until_blocked and self.is_in_bottomless_pit(pos):
                         return False
                     sand_pos = pos
@@ -74,14 +92,14 @@ class Grid:
             else:
                 break
 
-        self.grid[sand_pos] = Tile.SAND
+        grid[sand_pos] = Tile.SAND
         return True
 
     def render(self, x1: int, y1: int, x2: int, y2: int):
         for y in range(y1, y2 + 1):
             print(f"{y:3}", end=" ")
             for x in range(x1, x2 + 1):
-                pos = Position(x, y)
+                pos = aocgrid.pack(x, y)
                 if pos == self.sand_entry_position:
                     c = "+"
                 elif pos not in self.grid:
@@ -95,6 +113,15 @@ class Grid:
         print()
 
 
+def lowest_rocks(rocks: dict[int, Tile]):
+    """Get the y of the lowest rock of every column that has one"""
+    keys = np.fromiter(rocks, dtype=np.uint64, count=len(rocks))
+    dense, (x0, y0) = aocgrid.to_dense(aocgrid.unpack_array(keys))
+    has_rock = dense.any(axis=0)
+    lowest = dense.shape[0] - 1 - np.argmax(dense[::-1], axis=0) + y0
+    return {x0 + int(x): int(lowest[x]) for x in np.flatnonzero(has_rock)}
+
+
 def parse_rocks(data: str):
     return [
         [Position(*map(int, step.split(","))) for step in line.split(" -> ")]
@@ -109,17 +136,29 @@ def nrange(a: int, b: int):
     yield from range(mn, mx + 1)
 
 
-def main(data: str):
-    grid = Grid(parse_rocks(data))
+def parse(data: str):
+    return parse_rocks(data)
+
+
+def part1(rocks: list[list[Position]]):
+    with phase("build grid"):
+        grid = Grid(rocks)
 
-    while grid.drop_sand():
-        pass
+    with phase("drop sand"):
+        while grid.drop_sand():
+            pass
 
     sands = grid.get_tiles(Tile.SAND)
-    print("Part 1:", len(sands))
+    return len(sands)
+
+
+def part2(rocks: list[list[Position]]):
+    with phase("build grid"):
+        grid = Grid(rocks)
 
-    while grid.drop_sand(until_blocked=True):
-        pass
+    with phase("drop sand"):
+        while grid.drop_sand(until_blocked=True):
+            pass
 
     # rocks = grid.get_tiles(Tile.ROCK)
     # xs = {r.x for r in rocks}
@@ -130,4 +169,4 @@ def main(data: str):
     # grid.render(mnx, 0, mxx, mxy)
 
     sands = grid.get_tiles(Tile.SAND)
-    print("Part 2:", len(sands))
+    return len(sands)
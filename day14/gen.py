@@ -0,0 +1,29 @@
+import math
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` rock paths in a cave that gets deeper with the scale.
+
+    The first path is a cup under the sand entry that fills and then spills
+    into the abyss, so both answers grow with the scale. The rest are kept
+    out of the upper half of the cave, which leaves the sand a clear funnel
+    instead of a rock right under the entry.
+    """
+    depth = max(10, math.isqrt(scale) * 10)
+    top = depth // 2
+    rim = depth // 4
+    yield f"{500 - rim},{top} -> {500 - rim},{depth} -> {500 + rim},{depth} -> {500 + rim},{top}"
+    for _ in range(scale - 1):
+        x = 500 + rng.randint(-depth, depth)
+        y = rng.randint(top, depth)
+        steps = [f"{x},{y}"]
+        for i in range(rng.randint(1, 4)):
+            length = rng.randint(1, 6)
+            if i % 2:
+                y = min(depth, max(top, y + rng.choice((-length, length))))
+            else:
+                x += rng.choice((-length, length))
+            steps.append(f"{x},{y}")
+        yield " -> ".join(steps)
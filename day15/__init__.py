@@ -1,13 +1,7 @@
 from __future__ import annotations
-import re
 from typing import NamedTuple
-import numpy as np
 
-intp = r"(-?\d+)"
-
-sensor_data_pattern = re.compile(
-    f"^Sensor at x={intp}, y={intp}: closest beacon is at x={intp}, y={intp}$"
-)
+from aoclib.ints import extract_ints
 
 
 class Vec2i(NamedTuple):
@@ -19,14 +13,17 @@ def calc_range(sensor: Vec2i, beacon: Vec2i):
     return abs(sensor.x - beacon.x) + abs(sensor.y - beacon.y)
 
 
-def main(data: str):
-    sensors: list[tuple[Vec2i, Vec2i]] = []
-    for line in data.splitlines():
-        m = sensor_data_pattern.match(line)
-        assert m is not None
-        at_x, at_y, to_x, to_y = map(int, m.groups())
+Sensors = list[tuple[Vec2i, Vec2i]]
+
+
+def parse(data: str) -> Sensors:
+    sensors: Sensors = []
+    for at_x, at_y, to_x, to_y in extract_ints(data, 4).tolist():
         sensors.append((Vec2i(at_x, at_y), Vec2i(to_x, to_y)))
+    return sensors
 
+
+def part1(sensors: Sensors):
     largest = max(s.y for s, _ in sensors)
     y = 10 if largest <= 20 else 2_000_000
     m = y * 2
@@ -44,6 +41,7 @@ def main(data: str):
         covered = range(start_x, end_x)
         covered_squares.update(covered)
 
-    print("Part 1:", len(covered_squares))
+    return len(covered_squares)
+
 
-    # Part 2 is hard
+# Part 2 is hard
@@ -0,0 +1,17 @@
+import math
+import random
+from typing import Iterator
+
+SIZE = 4_000_000
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` sensors, each reporting the closest of a few beacons"""
+    beacons = [
+        (rng.randint(0, SIZE), rng.randint(0, SIZE))
+        for _ in range(min(50, max(1, math.isqrt(scale))))
+    ]
+    for _ in range(scale):
+        x, y = rng.randint(0, SIZE), rng.randint(0, SIZE)
+        bx, by = min(beacons, key=lambda b: abs(b[0] - x) + abs(b[1] - y))
+        yield f"Sensor at x={x}, y={y}: closest beacon is at x={bx}, y={by}"
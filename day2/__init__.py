@@ -1,5 +1,10 @@
 from enum import Enum
-from typing import Iterable, Literal
+from typing import Callable, Iterable
+
+import numpy as np
+
+from aoclib.inputs import Input, streaming
+from aoclib.ints import line_chunks
 
 
 class Move(Enum):
@@ -74,40 +79,44 @@ class Game:
             self.score += own.score + self.play_round(opponent, own).score
 
 
-ABC = Literal["A", "B", "C"]
-XYZ = Literal["X", "Y", "Z"]
-MoveData = list[tuple[ABC, XYZ]]
+# the column of the strategy guide is read as a move in part 1
+COLUMN_MOVES = {"X": Move.ROCK, "Y": Move.PAPER, "Z": Move.SCISSORS}
 
 
-def parse_data(data: str) -> MoveData:
-    return [tuple(line.split()) for line in data.splitlines()]  # type: ignore
+def score_table(own_move: Callable[[Move, str], Move]) -> np.ndarray:
+    """Score every possible round with the classes above.
 
+    The score of the round ``"A Y"`` is at ``table[0 * 3 + 1]``.
+    """
+    table = np.zeros(9, dtype=np.int64)
+    for i, opponent in enumerate(Move):
+        for j, column in enumerate("XYZ"):
+            own = own_move(opponent, column)
+            table[i * 3 + j] = own.score + Game().play_round(opponent, own).score
+    return table
 
-def main(data: str):
-    movedata = parse_data(data)
-    print("Part 1:", part1(movedata))
-    print("Part 2:", part2(movedata))
 
+PART1_SCORES = score_table(lambda opponent, column: COLUMN_MOVES[column])
+PART2_SCORES = score_table(
+    lambda opponent, column: get_next_move(opponent, MatchResult(column))
+)
 
-def part1(data: MoveData):
-    move_map = {"X": "A", "Y": "B", "Z": "C"}
 
-    def map_data(line: tuple[ABC, XYZ]):
-        a, b = line
-        return Move(a), Move(move_map[b])
+@streaming
+def parse(data: Input) -> np.ndarray:
+    """Count how often each of the nine possible rounds is played"""
+    counts = np.zeros(9, dtype=np.int64)
+    for chunk in line_chunks(data):
+        buf = np.frombuffer(chunk, dtype=np.uint8)
+        letters = buf[(buf >= ord("A")) & (buf <= ord("Z"))].reshape(-1, 2)
+        rounds = (letters[:, 0] - ord("A")) * 3 + letters[:, 1] - ord("X")
+        counts += np.bincount(rounds, minlength=9)
+    return counts
 
-    game = Game()
-    game.play(map(map_data, data))
-    return game.score
 
+def part1(counts: np.ndarray):
+    return int(counts @ PART1_SCORES)
 
-def part2(data: MoveData):
-    def map_data(line: tuple[ABC, XYZ]):
-        a, b = line
-        move = Move(a)
-        result = MatchResult(b)
-        return move, get_next_move(move, result)
 
-    game = Game()
-    game.play(map(map_data, data))
-    return game.score
+def part2(counts: np.ndarray):
+    return int(counts @ PART2_SCORES)
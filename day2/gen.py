@@ -0,0 +1,8 @@
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` rounds of rock paper scissors"""
+    for _ in range(scale):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}"
@@ -1,5 +1,10 @@
 import string
 
+import numpy as np
+
+from aoclib.inputs import Input, streaming
+from aoclib.ints import line_chunks
+
 
 def split_evently(lst: list, count: int):
     for i in range(0, len(lst), count):
@@ -11,6 +16,7 @@ def get_priority(c: str):
     return string.ascii_letters.index(c) + 1
 
 
+# Rucksack and Group are the readable version of what the masks below do
 class Rucksack:
     def __init__(self, contents: str):
         self.contents = contents
@@ -35,9 +41,46 @@ class Group:
         return set.intersection(*contents).pop()
 
 
-def main(data: str):
-    rucksacks = [*map(Rucksack, data.splitlines())]
-    print("Part 1:", sum(get_priority(c.shared_item) for c in rucksacks))
+# the bit of every item in a priority mask, where priority p is bit p - 1
+ITEM_BITS = np.zeros(256, dtype=np.uint64)
+for priority, c in enumerate(string.ascii_letters, 1):
+    ITEM_BITS[ord(c)] = 1 << (priority - 1)
+
+
+def compartment_masks(chunk: bytes) -> np.ndarray:
+    """Get the priority masks of both compartments of every rucksack in a
+    chunk of whole lines, as an ``(n, 2)`` array"""
+    buf = np.frombuffer(chunk, dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord("\n"))
+    if buf.size and buf[-1] != ord("\n"):
+        ends = np.append(ends, buf.size)
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    middles = starts + (ends - starts) // 2
+    # every line ends with a newline, whose bit is 0, so ORing from each start
+    # to the next middle and from each middle to the next start never mixes
+    # rucksacks
+    bounds = np.stack([starts, middles], axis=1).ravel()
+    bits = np.append(ITEM_BITS[buf], np.uint64(0))
+    return np.bitwise_or.reduceat(bits, bounds).reshape(-1, 2)
+
+
+def priorities(masks: np.ndarray) -> np.ndarray:
+    """Get the priority of the single item in each mask"""
+    # masks have at most 52 bits, which float64 holds exactly
+    return np.log2(masks.astype(np.float64)).astype(np.int64) + 1
+
+
+@streaming
+def parse(data: Input) -> np.ndarray:
+    chunks = [compartment_masks(chunk) for chunk in line_chunks(data)]
+    return np.concatenate([np.zeros((0, 2), dtype=np.uint64), *chunks])
+
+
+def part1(masks: np.ndarray):
+    return int(priorities(masks[:, 0] & masks[:, 1]).sum())
+
 
-    groups = [Group(rs) for rs in split_evently(rucksacks, 3)]
-    print("Part 2:", sum(get_priority(g.badge) for g in groups))
+def part2(masks: np.ndarray):
+    contents = (masks[:, 0] | masks[:, 1]).reshape(-1, 3)
+    badges = contents[:, 0] & contents[:, 1] & contents[:, 2]
+    return int(priorities(badges).sum())
@@ -0,0 +1,33 @@
+import random
+import string
+from typing import Iterator
+
+
+def rucksack(pool: list[str], badge: str, rng: random.Random):
+    shared = rng.choice(pool + [badge])
+    rest = [c for c in pool if c != shared]
+    rng.shuffle(rest)
+    left_items = rest[: len(rest) // 2]
+    right_items = rest[len(rest) // 2 :]
+
+    size = rng.randint(4, 16)
+    left = [shared]
+    # the badge is either the shared item or only in the first compartment
+    if badge != shared:
+        left.append(badge)
+    left += rng.choices(left_items, k=size - len(left))
+    right = [shared] + rng.choices(right_items, k=size - 1)
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left + right)
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` rucksacks, rounded up to whole groups of 3"""
+    for _ in range(-(-scale // 3)):
+        letters = list(string.ascii_letters)
+        rng.shuffle(letters)
+        badge, *rest = letters
+        # every elf of a group packs from their own letters, plus the badge
+        for i in range(3):
+            yield rucksack(rest[i::3], badge, rng)
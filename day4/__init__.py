@@ -1,17 +1,22 @@
-def parse_sections(s: str):
-    start, end = map(int, s.split("-"))
-    return set(range(start, end + 1))
+import numpy as np
 
+from aoclib.inputs import Input, streaming
+from aoclib.ints import extract_ints
 
-def main(data: str):
-    redudnant_count = 0
-    overlapping_count = 0
-    for line in data.splitlines():
-        # e - elf
-        e1, e2 = map(parse_sections, line.split(","))
-        if e1.issubset(e2) or e1.issuperset(e2):
-            redudnant_count += 1
-        if e1.intersection(e2):
-            overlapping_count += 1
-    print("Part 1:", redudnant_count)
-    print("Part 2:", overlapping_count)
+
+@streaming
+def parse(data: Input) -> np.ndarray:
+    """Get the sections of every pair as rows of start1, end1, start2, end2"""
+    return extract_ints(data, 4)
+
+
+def part1(pairs: np.ndarray):
+    s1, e1, s2, e2 = pairs.T
+    contains = (s1 <= s2) & (e2 <= e1) | (s2 <= s1) & (e1 <= e2)
+    return int(np.count_nonzero(contains))
+
+
+def part2(pairs: np.ndarray):
+    s1, e1, s2, e2 = pairs.T
+    overlaps = (s1 <= e2) & (s2 <= e1)
+    return int(np.count_nonzero(overlaps))
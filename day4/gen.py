@@ -0,0 +1,11 @@
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` pairs of elves, with section ids growing with the scale"""
+    highest = max(99, scale)
+    for _ in range(scale):
+        a, b = sorted(rng.randint(1, highest) for _ in range(2))
+        c, d = sorted(rng.randint(1, highest) for _ in range(2))
+        yield f"{a}-{b},{c}-{d}"
@@ -1,17 +1,16 @@
-import re
 from typing import NamedTuple, Iterable
 
-move_pattern = re.compile(r"^move (\d+) from (\d+) to (\d+)$")
+from aoclib.ints import extract_ints
 
 
 def parse_board(data: str):
     lines = data.splitlines()[::-1]
-    board = {int(stack): [] for stack in lines[0].split()}
+    board = {int(stack): bytearray() for stack in lines[0].split()}
     for layer in lines[1:]:
         for i in range(len(board)):
             crate = layer[(i * 4) + 1]
             if crate != " ":
-                board[i + 1].append(crate)
+                board[i + 1].append(ord(crate))
 
     return board
 
@@ -23,30 +22,57 @@ class Move(NamedTuple):
 
 
 def parse_moves(data: str):
-    for line in data.splitlines():
-        move = move_pattern.match(line)
-        if move:
-            yield Move(*map(int, move.groups()))
+    for count, frm, to in extract_ints(data, 3).tolist():
+        yield Move(count, frm, to)
 
 
-def main(data: str):
+# a crate is one byte, so moving crates between stacks is a memcpy
+Board = dict[int, bytearray]
+
+
+def parse(data: str) -> tuple[Board, list[Move]]:
     board, moves = data.split("\n\n")
-    for func in part_1, part_2:
-        func(parse_board(board), parse_moves(moves))
+    return parse_board(board), list(parse_moves(moves))
+
+
+def copy_board(board: Board) -> Board:
+    return {k: bytearray(v) for k, v in board.items()}
+
+
+def part1(data: tuple[Board, list[Move]]):
+    board, moves = data
+    return part_1(copy_board(board), moves)
+
+
+def part2(data: tuple[Board, list[Move]]):
+    board, moves = data
+    return part_2(copy_board(board), moves)
+
+
+def top_crates(board: Board):
+    return "".join(chr(b[-1]) for b in board.values())
+
+
+def take(board: Board, m: Move):
+    """Remove the top ``m.count`` crates of a stack, bottom first"""
+    stack = board[m.frm]
+    # not stack[-m.count :], which is the whole stack for a count of 0
+    cut = max(len(stack) - m.count, 0)
+    crates = stack[cut:]
+    del stack[cut:]
+    return crates
 
 
-def part_1(board: dict[int, list[str]], moves: Iterable[Move]):
+def part_1(board: Board, moves: Iterable[Move]):
+    # the CrateMover 9000 moves crates one at a time, which reverses them
     for m in moves:
-        for _ in range(m.count):
-            board[m.to].append(board[m.frm].pop())
+        board[m.to] += take(board, m)[::-1]
 
-    print("Part 1:", "".join(b[-1] for b in board.values()))
+    return top_crates(board)
 
 
-def part_2(board: dict[int, list[str]], moves: Iterable[Move]):
+def part_2(board: Board, moves: Iterable[Move]):
     for m in moves:
-        crates = board[m.frm][-m.count:]
-        board[m.frm][-m.count:] = []
-        board[m.to].extend(crates)
+        board[m.to] += take(board, m)
 
-    print("Part 2:", "".join(b[-1] for b in board.values()))
+    return top_crates(board)
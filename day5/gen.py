@@ -0,0 +1,27 @@
+import random
+import string
+from typing import Iterator
+
+STACKS = 9
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` moves over 9 stacks that start with about ``scale`` crates"""
+    stacks = [
+        rng.choices(string.ascii_uppercase, k=rng.randint(2, max(2, scale // STACKS)))
+        for _ in range(STACKS)
+    ]
+    for level in range(max(map(len, stacks)) - 1, -1, -1):
+        yield " ".join(f"[{s[level]}]" if level < len(s) else "   " for s in stacks)
+    yield " " + "   ".join(str(i) for i in range(1, STACKS + 1)) + " "
+    yield ""
+
+    heights = [len(s) for s in stacks]
+    for _ in range(scale):
+        # never empty a stack, so every stack has a crate on top at the end
+        frm = rng.choice([i for i, h in enumerate(heights) if h > 1])
+        to = rng.choice([i for i in range(STACKS) if i != frm])
+        count = rng.randint(1, heights[frm] - 1)
+        heights[frm] -= count
+        heights[to] += count
+        yield f"move {count} from {frm + 1} to {to + 1}"
@@ -1,14 +1,95 @@
-def main(data: str):
-    for line in data.splitlines():
-        part = 1
-        c = 4
-        for i in range(len(line)):
-            end = i + c
-            signal = line[i:end]
-            if len(set(signal)) == len(signal):
-                print(f"Part {part}: {end}", end=", ")
-                if part == 2:
-                    break
-                part = 2
-                c = 14
-        print()
+import numpy as np
+
+from aoclib.inputs import Input, streaming
+
+# window sizes of the start-of-packet and start-of-message markers
+SIZES = (4, 14)
+
+# bytes fed to a MarkerFinder at a time, which bounds its temporary arrays
+CHUNK_SIZE = 16 * 1024
+
+
+class MarkerFinder:
+    """Finds the first marker of every window size in one pass over a signal.
+
+    The last index every byte was seen at is kept, so the run of distinct
+    bytes ending at each position is known without looking back into the
+    window. The signal can be fed in chunks of any size.
+    """
+
+    def __init__(self, sizes: tuple[int, ...]):
+        self.last_seen = np.full(256, -1, dtype=np.int64)
+        # where the run of distinct bytes ending at the last byte fed starts
+        self.run_start = 0
+        self.length = 0
+        self.markers: dict[int, int | None] = dict.fromkeys(sizes)
+
+    @property
+    def done(self):
+        return None not in self.markers.values()
+
+    def feed(self, chunk: bytes):
+        buf = np.frombuffer(chunk, dtype=np.uint8)
+        if not buf.size or self.done:
+            self.length += buf.size
+            return
+        index = self.length + np.arange(buf.size)
+
+        # the previous index of every byte, from within the chunk if it is
+        # there and from last_seen if not
+        order = np.argsort(buf, kind="stable")
+        grouped = buf[order]
+        first = np.ones(buf.size, dtype=bool)
+        first[1:] = grouped[1:] != grouped[:-1]
+        previous_sorted = np.empty(buf.size, dtype=np.int64)
+        previous_sorted[1:] = index[order][:-1]
+        previous_sorted[first] = self.last_seen[grouped[first]]
+        previous = np.empty(buf.size, dtype=np.int64)
+        previous[order] = previous_sorted
+
+        last = np.append(first[1:], True)
+        self.last_seen[grouped[last]] = index[order][last]
+
+        run_start = np.maximum.accumulate(np.maximum(previous + 1, self.run_start))
+        run_length = index - run_start + 1
+        for size, marker in self.markers.items():
+            if marker is None and (hits := np.flatnonzero(run_length >= size)).size:
+                self.markers[size] = int(index[hits[0]]) + 1
+
+        self.run_start = int(run_start[-1])
+        self.length += buf.size
+
+
+def find_markers(data: Input, sizes: tuple[int, ...] = SIZES):
+    """Get the markers of every signal, one per line, reading it in chunks"""
+    finders = [MarkerFinder(sizes)]
+    for chunk in data.chunks(CHUNK_SIZE):
+        *lines, rest = chunk.split(b"\n")
+        for line in lines:
+            finders[-1].feed(line)
+            finders.append(MarkerFinder(sizes))
+        finders[-1].feed(rest)
+    if len(finders) > 1 and not finders[-1].length:
+        # the newline at the end of the input
+        finders.pop()
+    return [f.markers for f in finders]
+
+
+def select(markers: list[dict[int, int | None]], size: int):
+    # the example has several signals, one per line
+    if len(markers) == 1:
+        return markers[0][size]
+    return [m[size] for m in markers]
+
+
+@streaming
+def parse(data: Input):
+    return find_markers(data)
+
+
+def part1(markers: list[dict[int, int | None]]):
+    return select(markers, 4)
+
+
+def part2(markers: list[dict[int, int | None]]):
+    return select(markers, 14)
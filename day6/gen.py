@@ -0,0 +1,10 @@
+import random
+import string
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A signal of about ``scale`` characters with both markers at the end"""
+    noise = "".join(rng.choices("abc", k=scale))
+    marker = rng.sample(string.ascii_lowercase[3:], 14)
+    yield noise + "".join(marker)
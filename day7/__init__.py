@@ -1,5 +1,10 @@
 import abc
-import os.path
+from array import array
+from typing import Iterable
+
+import numpy as np
+
+from aoclib.inputs import Input, streaming
 
 
 class Node(abc.ABC):
@@ -23,32 +28,65 @@ class Node(abc.ABC):
 class DirNode(Node):
     def __init__(self, name: str):
         super().__init__(name)
-        self.children: list[Node] = []
+        self.parent: DirNode | None = None
+        self.children: dict[str, Node] = {}
+        self._size: int | None = None
+
+    def add(self, node: Node):
+        if isinstance(node, DirNode):
+            # listing a directory again mustn't drop what is known below it
+            if isinstance(self.children.get(node.name), DirNode):
+                return
+            node.parent = self
+        self.children[node.name] = node
+        self.invalidate()
+
+    def invalidate(self):
+        # a cached size means every size below it is cached too, so the first
+        # directory without one ends the walk
+        node: DirNode | None = self
+        while node is not None and node._size is not None:
+            node._size = None
+            node = node.parent
 
     def get_node(self, name: str):
-        return next(c for c in self.children if c.name == name)
+        return self.children[name]
 
     def resolve(self, path: str):
-        if path == "/":
-            return root
-        nodes = path.split("/")[1:]
         node = self
-        for n in nodes:
+        if path.startswith("/"):
+            node = self.root
+        for n in path.split("/"):
+            if n in ("", "."):
+                continue
+            if n == "..":
+                node = node.parent or node
+                continue
             node = node.get_node(n)
 
             if not isinstance(node, DirNode):
                 raise AssertionError("node was not a dir: " + str(node))
         return node
 
+    @property
+    def root(self):
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
     def dirs(self):
-        yield self
-        for c in self.children:
-            if isinstance(c, DirNode):
-                yield from c.dirs()
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(c for c in node.children.values() if isinstance(c, DirNode))
 
     @property
     def size(self):
-        return sum(c.size for c in self.children)
+        if self._size is None:
+            self._size = sum(c.size for c in self.children.values())
+        return self._size
 
 
 class FileNode(Node):
@@ -61,26 +99,30 @@ class FileNode(Node):
         return self._size
 
 
-root = DirNode("")
-
-
 class Shell:
-    def __init__(self):
-        self.cwd = "/"
+    """Replays a terminal log into a filesystem tree of its own"""
 
-    def get_cwd_node(self):
-        return root.resolve(self.cwd)
+    def __init__(self):
+        self.root = DirNode("")
+        self.cwd = self.root
 
     def handle_cmd(self, cmd: str, args: list[str], result: list[str]):
         if cmd == "cd":
             (path,) = args
-            self.cwd = os.path.normpath(os.path.join(self.cwd, path))
+            if "/" in path or path in ("..", "."):
+                self.cwd = self.cwd.resolve(path)
+            else:
+                node = self.cwd.children.get(path)
+                if not isinstance(node, DirNode):
+                    node = DirNode(path)
+                    self.cwd.add(node)
+                self.cwd = node
         elif cmd == "ls":
-            node = self.get_cwd_node()
-            node.children.extend(map(Node.parse, result))
+            for node in map(Node.parse, result):
+                self.cwd.add(node)
 
 
-def main(data: str):
+def build_tree(data: str):
     s = Shell()
     command = None
     args = []
@@ -95,16 +137,90 @@ def main(data: str):
             result.append(line)
     if command is not None:
         s.handle_cmd(command, args, result)
-
-    # part 1
-    print("Part 1:", sum(d.size for d in root.dirs() if d.size < 100000))
-
-    # part 2
+    return s.root
+
+
+def dir_totals(lines: Iterable[str]) -> np.ndarray:
+    """Total every directory while reading the log, without building a tree.
+
+    Every directory gets an index into the totals, the root first. The
+    directories from the root to the current one are kept as a stack of the
+    sizes found in them since they were entered, and leaving one adds that to
+    its total and to its parent's. A directory's files are counted from its
+    first listing only, so revisiting or listing it again counts nothing twice.
+    """
+    totals = array("q", [0])
+    # the index of every directory seen, by its parent's index and its name
+    children: dict[tuple[int, str], int] = {}
+    listed = set()
+    counting = False
+    stack = [0]
+    found = [0]
+
+    def child(name: str):
+        key = (stack[-1], name)
+        if key not in children:
+            children[key] = len(totals)
+            totals.append(0)
+        return children[key]
+
+    def leave(depth: int):
+        while len(stack) > depth:
+            size = found.pop()
+            totals[stack.pop()] += size
+            found[-1] += size
+
+    for line in lines:
+        if line.startswith("$ "):
+            counting = False
+            if line == "$ ls":
+                counting = stack[-1] not in listed
+                listed.add(stack[-1])
+            elif line.startswith("$ cd "):
+                path = line[5:]
+                if path.startswith("/"):
+                    leave(1)
+                for name in path.split("/"):
+                    if name in ("", "."):
+                        continue
+                    if name == "..":
+                        leave(max(len(stack) - 1, 1))
+                    else:
+                        stack.append(child(name))
+                        found.append(0)
+        elif counting:
+            size, name = line.split(" ", 1)
+            if size == "dir":
+                child(name)
+            else:
+                found[-1] += int(size)
+    leave(1)
+    totals[0] += found[0]
+    return np.frombuffer(totals, dtype=np.int64)
+
+
+def tree_totals(data: str) -> np.ndarray:
+    """Total every directory of the tree built by replaying the whole log,
+    which is what dir_totals is checked against"""
+    root = build_tree(data)
+    return np.array([d.size for d in root.dirs()], dtype=np.int64)
+
+
+@streaming
+def parse(data: Input):
+    return dir_totals(data.lines())
+
+
+def part1(totals: np.ndarray):
+    return int(totals[totals < 100000].sum())
+
+
+def part2(totals: np.ndarray):
     total_storage = 70_000_000
     required_storage = 30_000_000
 
-    storage_used = root.size
+    storage_used = totals[0]
     storage_free = total_storage - storage_used
     to_free = required_storage - storage_free
 
-    print("Part 2:", min(c.size for c in root.dirs() if c.size > to_free))
+    return int(totals[totals > to_free].min())
@@ -0,0 +1,51 @@
+import random
+import string
+from typing import Iterator
+
+MAX_DEPTH = 40
+
+
+def name(rng: random.Random, taken: set[str]):
+    while True:
+        n = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 8)))
+        if rng.random() < 0.5:
+            n += "." + "".join(rng.choices(string.ascii_lowercase, k=3))
+        if n not in taken:
+            taken.add(n)
+            return n
+
+
+def directory(budget: int, depth: int, rng: random.Random) -> Iterator[str]:
+    yield "$ ls"
+    if depth < MAX_DEPTH:
+        count = min(budget, rng.randint(1, 12))
+        dirs = sum(rng.random() < 0.3 for _ in range(count))
+    else:
+        count = budget
+        dirs = 0
+    remaining = budget - count
+    # something has to hold the rest of the budget
+    if remaining and not dirs:
+        dirs = 1
+
+    taken: set[str] = set()
+    subdirs = []
+    for i in rng.sample(range(count), count):
+        if i < dirs:
+            subdirs.append(name(rng, taken))
+            yield f"dir {subdirs[-1]}"
+        else:
+            yield f"{rng.randint(1000, 300_000)} {name(rng, taken)}"
+
+    # split what is left of the budget between the subdirectories
+    cuts = sorted(rng.randint(0, remaining) for _ in range(len(subdirs) - 1))
+    for d, start, end in zip(subdirs, [0, *cuts], [*cuts, remaining]):
+        yield f"$ cd {d}"
+        yield from directory(end - start, depth + 1, rng)
+        yield "$ cd .."
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A terminal log listing about ``scale`` files and directories"""
+    yield "$ cd /"
+    yield from directory(scale, 0, rng)
@@ -1,10 +1,35 @@
 import numpy as np
 
+from aocgrid import byte_table, parse_grid
+
+LEVELS = 10
+heights = byte_table({str(n): n for n in range(LEVELS)})
+
+
+def visible_from_start(trees: np.ndarray) -> np.ndarray:
+    """Which trees are taller than every tree before them along axis 0"""
+    visible = np.ones(trees.shape, dtype=bool)
+    tallest = np.maximum.accumulate(trees, axis=0)
+    visible[1:] = trees[1:] > tallest[:-1]
+    return visible
+
+
+def viewing_distances(trees: np.ndarray) -> np.ndarray:
+    """How many trees every tree sees towards the start of axis 0"""
+    distances = np.empty(trees.shape, dtype=np.int64)
+    columns = np.arange(trees.shape[1])
+    levels = np.arange(LEVELS)[:, None]
+    # per column, the last row with a tree at least as tall as each height
+    last = np.zeros((LEVELS, trees.shape[1]), dtype=np.int64)
+    for i, row in enumerate(trees):
+        distances[i] = i - last[row, columns]
+        np.putmask(last, levels <= row, i)
+    return distances
+
 
 class Trees:
     def __init__(self, data: str):
-        trees = [list(row) for row in data.splitlines()]
-        self.trees = np.array(trees, dtype="byte")
+        self.trees = parse_grid(data, heights)
 
     def get_tree(self, x: int, y: int):
         return self.trees[y][x]
@@ -19,9 +44,9 @@ class Trees:
         row = self.get_row(y)
         col = self.get_column(x)
         row_left = row[:x]
-        row_right = row[x + 1:]
+        row_right = row[x + 1 :]
         col_top = col[:y]
-        col_bottom = col[y + 1:]
+        col_bottom = col[y + 1 :]
         t = self.get_tree(x, y)
         # print(row_left, t, row_right)
         return (
@@ -31,15 +56,14 @@ class Trees:
             and np.amax(col_bottom) >= t
         )
 
-    def visibility_map(self):
-        # the edges get an automatic fail
-        yield from [0] * self.trees.shape[0]
-        for y in range(1, self.trees.shape[0] - 1):
-            yield 0
-            for x in range(1, self.trees.shape[1] - 1):
-                yield self.is_tree_visible(x, y)
-            yield 0
-        yield from [0] * self.trees.shape[0]
+    def visibility_mask(self):
+        t = self.trees
+        return (
+            visible_from_start(t)
+            | visible_from_start(t[::-1])[::-1]
+            | visible_from_start(t.T).T
+            | visible_from_start(t.T[::-1])[::-1].T
+        )
 
     def score_view(self, x: int, y: int):
         t = self.get_tree(x, y)
@@ -65,28 +89,26 @@ class Trees:
                 break
         return left_score * right_score * top_score * bottom_score
 
-    def viewability_map(self):
-        for y in range(self.trees.shape[0]):
-            for x in range(self.trees.shape[1]):
-                yield self.score_view(x, y)
-
-    def map_array(self, func):
-        return np.array([*func()]).reshape(self.trees.shape)
+    def scenic_scores(self):
+        t = self.trees
+        return (
+            viewing_distances(t)
+            * viewing_distances(t[::-1])[::-1]
+            * viewing_distances(t.T).T
+            * viewing_distances(t.T[::-1])[::-1].T
+        )
 
     def __str__(self):
         return str(self.trees)
 
 
-def main(data: str):
-    trees = Trees(data)
-    # print(trees)
-    visible = trees.map_array(trees.visibility_map)
-    # print((3, 1), trees.is_tree_visible(3, 1))
-    # print(visible)
-    # print(visible.reshape(trees.trees.shape))
-    print("Part 1:", np.count_nonzero(visible == 0))
+def parse(data: str):
+    return Trees(data)
+
+
+def part1(trees: Trees):
+    return int(np.count_nonzero(trees.visibility_mask()))
+
 
-    trees_view = trees.map_array(trees.viewability_map)
-    # print(trees.score_view(2, 3))
-    # print(trees_view)
-    print("Part 2:", np.amax(trees_view))
+def part2(trees: Trees):
+    return int(trees.scenic_scores().max())
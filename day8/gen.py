@@ -0,0 +1,8 @@
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """A ``scale`` by ``scale`` forest"""
+    for _ in range(scale):
+        yield "".join(rng.choices("0123456789", k=scale))
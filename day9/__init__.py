@@ -64,7 +64,7 @@ class Rope:
             m = int(m)
             self.step(d, m)
 
-        print(len(self.tail_visited))
+        return len(self.tail_visited)
 
     def print_stage(self):
         if self.debug_size is None:
@@ -92,14 +92,20 @@ class Rope:
         print()
 
 
-def main(data: str):
+def parse(data: str):
     dataset = data.split("\n\n")
     # example data has 2 versions for each part, split by an empty line
     if len(dataset) == 1:
         dataset = dataset * 2
     data1, data2 = dataset
+    return data1, data2
 
-    # part 1, 2 knots
-    Rope().run(data1)
-    # part 2, 10 knots
-    Rope(10).run(data2)
+
+def part1(dataset: tuple[str, str]):
+    # 2 knots
+    return Rope().run(dataset[0])
+
+
+def part2(dataset: tuple[str, str]):
+    # 10 knots
+    return Rope(10).run(dataset[1])
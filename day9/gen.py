@@ -0,0 +1,8 @@
+import random
+from typing import Iterator
+
+
+def generate(scale: int, rng: random.Random) -> Iterator[str]:
+    """``scale`` head motions"""
+    for _ in range(scale):
+        yield f"{rng.choice('UDLR')} {rng.randint(1, 20)}"
@@ -0,0 +1,14 @@
+"""Shared by the tests: the repository root, which every test runs from, and
+the expected answers and budgets of every day."""
+import json
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+EXPECTED = json.loads((Path(__file__).parent / "expected.json").read_text())
+
+
+@pytest.fixture(autouse=True)
+def in_root(monkeypatch):
+    monkeypatch.chdir(ROOT)
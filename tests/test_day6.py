@@ -0,0 +1,30 @@
+"""day6's chunked marker search against a plain window check."""
+import random
+import string
+
+import pytest
+
+import day6
+from aoclib.inputs import Input
+
+
+def brute_force(signal: str, size: int):
+    for end in range(size, len(signal) + 1):
+        if len(set(signal[end - size : end])) == size:
+            return end
+    return None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_chunk_boundaries(monkeypatch, chunk_size: int):
+    rng = random.Random(chunk_size)
+    signals = [
+        "".join(rng.choices(string.ascii_lowercase[: rng.randint(3, 26)], k=300))
+        for _ in range(50)
+    ]
+
+    monkeypatch.setattr(day6, "CHUNK_SIZE", chunk_size)
+    markers = day6.find_markers(Input(data="\n".join(signals).encode() + b"\n"))
+    assert markers == [
+        {size: brute_force(s, size) for size in day6.SIZES} for s in signals
+    ]
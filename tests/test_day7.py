@@ -0,0 +1,83 @@
+"""day7's streaming totals against the tree built from the whole log."""
+import pytest
+
+import day7
+from aoclib.generate import generate_text
+from aoclib.inputs import Input
+from conftest import EXPECTED
+
+REVISITS = """\
+$ cd /
+$ ls
+100 r
+dir a
+$ cd a
+$ ls
+200 x
+dir b
+$ cd b
+$ ls
+50 y
+$ cd /
+$ ls
+100 r
+dir a
+$ cd a
+$ ls
+200 x
+dir b
+$ cd ..
+$ cd a
+$ cd b
+$ cd ..
+$ cd ..
+$ cd ..
+"""
+
+PATHS = """\
+$ cd /
+$ ls
+dir a
+10 r
+$ cd a
+$ ls
+dir b
+7 h
+$ cd /a/b
+$ ls
+dir x
+100 f
+$ cd ../b/x
+$ ls
+5 g
+$ cd /
+$ ls
+10 r
+dir a
+$ cd ./a/b
+$ ls
+dir x
+100 f
+$ cd ../../a
+"""
+
+
+@pytest.mark.parametrize("name", ["example", "data"])
+def test_tree_answers(name: str):
+    text = Input.for_day("7", example=name == "example").text()
+    totals = day7.tree_totals(text)
+    assert [day7.part1(totals), day7.part2(totals)] == EXPECTED["7"][name]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param(REVISITS, id="revisits"),
+        pytest.param(PATHS, id="paths"),
+        *(pytest.param(generate_text("7", s, s), id=f"scale{s}") for s in (1, 20, 500)),
+    ],
+)
+def test_matches_tree(text: str):
+    totals = day7.dir_totals(text.splitlines())
+    assert sorted(totals.tolist()) == sorted(day7.tree_totals(text).tolist())
+    assert totals[0] == day7.build_tree(text).size
@@ -0,0 +1,65 @@
+"""Answers and performance budgets of every day.
+
+Expected answers and budgets are kept in expected.json. Budgets are checked
+on an input generated at the given scale, see dayN/gen.py. They allow about
+3-5 times the time the day takes and up to twice its peak memory, so a change
+that makes a day faster should tighten its budget too.
+"""
+import importlib
+
+import pytest
+
+from aoclib.bench import format_bytes, measure_peak, measure_time
+from aoclib.cli import discover_days
+from aoclib.generate import generate_text
+from aoclib.inputs import Input
+from aoclib.runner import solve
+from conftest import EXPECTED, ROOT
+
+DAYS = discover_days(ROOT)
+
+
+def answer_params():
+    for day in DAYS:
+        for name in ("example", "data"):
+            yield pytest.param(day, name, id=f"day{day}-{name}")
+
+
+def answers(day: str, data: Input):
+    return [r.answer for r in solve(day, data) if r.part != "parse"]
+
+
+def test_every_day_has_expected_answers():
+    assert set(DAYS) == set(EXPECTED)
+
+
+@pytest.mark.parametrize("day, name", list(answer_params()))
+def test_answers(day: str, name: str):
+    data = Input.for_day(day, example=name == "example")
+    assert answers(day, data) == EXPECTED[day][name]
+
+
+@pytest.mark.budget
+@pytest.mark.parametrize("day", DAYS, ids=lambda day: f"day{day}")
+def test_budget(day: str):
+    budget = EXPECTED[day]["budget"]
+    text = generate_text(day, budget["scale"])
+    importlib.import_module(f"day{day}")
+
+    def run():
+        answers(day, Input.from_text(text))
+
+    seconds = measure_time(run)
+    assert seconds <= budget["seconds"], f"took {seconds:.3f}s"
+    if "peak_bytes" in budget:
+        peak = measure_peak(run)
+        assert peak <= budget["peak_bytes"], f"peak memory {format_bytes(peak)}"
+
+
+def test_day14_scales():
+    # a rock right under the sand entry would stop both answers growing, and
+    # bench's scaling estimate with them
+    part1 = [
+        answers("14", Input.from_text(generate_text("14", s)))[0] for s in (1, 10, 50)
+    ]
+    assert 0 < part1[0] < part1[1] < part1[2]
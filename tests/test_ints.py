@@ -0,0 +1,64 @@
+"""The integer extractor shared by the days, see aoclib/ints.py."""
+import numpy as np
+import pytest
+
+import aoclib.ints
+from aoclib.inputs import Input
+from aoclib.ints import extract_ints
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("2-4,6-8", [2, 4, 6, 8]),
+        ("x=-5, y=12", [-5, 12]),
+        ("10--3", [10, -3]),
+        ("-7\n-8", [-7, -8]),
+        ("move 1 from 20 to 300", [1, 20, 300]),
+        ("999999999999999999", [999999999999999999]),
+    ],
+)
+def test_signs(text: str, expected: list[int]):
+    assert extract_ints(text).tolist() == expected
+
+
+def test_too_many_digits():
+    with pytest.raises(ValueError):
+        extract_ints("1234567890123456789")
+
+
+def test_no_integers():
+    with pytest.raises(ValueError):
+        extract_ints("no numbers here\n")
+
+
+def test_fields():
+    assert extract_ints("1-2,3-4\n5-6,7-8\n", 4).tolist() == [
+        [1, 2, 3, 4],
+        [5, 6, 7, 8],
+    ]
+    with pytest.raises(ValueError):
+        extract_ints("1 2 3", 2)
+
+
+def test_offsets():
+    text = "12\n\n-3 x 456\n"
+    ints, starts = extract_ints(text, offsets=True)
+    assert ints.tolist() == [12, -3, 456]
+    assert starts.tolist() == [text.index("12"), text.index("3"), text.index("456")]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_chunk_boundaries(monkeypatch, chunk_size: int):
+    rng = np.random.default_rng(chunk_size)
+    numbers = rng.integers(-(10**12), 10**12, 500).tolist()
+    text = ""
+    expected_starts = []
+    for n in numbers:
+        expected_starts.append(len(text) + (n < 0))
+        text += f"{n}{rng.choice([' ', chr(10)])}"
+
+    monkeypatch.setattr(aoclib.ints, "CHUNK_SIZE", chunk_size)
+    ints, starts = extract_ints(Input(data=text.encode()), offsets=True)
+    assert ints.tolist() == numbers
+    assert starts.tolist() == expected_starts